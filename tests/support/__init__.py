@@ -0,0 +1,6 @@
+"""Shared infrastructure for the UI test classes.
+
+Submodules are imported explicitly (``from support.session import ...``):
+``support.config`` reads ``APP_BASE_URL`` at import time, and the parallel
+runner must be able to import this package before setting it.
+"""
@@ -0,0 +1,82 @@
+"""Non-blocking capture of ``window.alert`` messages.
+
+The app reports a successful transfer with a blocking ``alert``. Reading
+it through ``switch_to.alert`` costs extra round trips and leaves the page
+blocked (and later commands failing with ``UnexpectedAlertPresent``) when
+a test forgets to accept it. With ``ALERT_MODE=capture`` a stub installed
+before any page script runs records the messages in an in-page queue
+instead; tests read the queue in batches. The default ``ALERT_MODE=dialog``
+keeps the real dialogs for fidelity runs.
+"""
+from selenium.common.exceptions import NoAlertPresentException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.devtools import add_document_script
+
+
+ALERT_TIMEOUT_MS = 5000
+
+ALERT_STUB = """
+(() => {
+    if (window.__alerts) {
+        return;
+    }
+    const queue = [];
+    const waiters = [];
+    Object.defineProperty(window, "__alerts", {value: {queue, waiters}});
+    window.alert = (message) => {
+        queue.push(String(message));
+        waiters.splice(0).forEach((wake) => wake());
+    };
+})();
+"""
+
+DRAIN_SCRIPT = "return window.__alerts ? window.__alerts.queue.splice(0) : [];"
+
+WAIT_SCRIPT = """
+const [count, timeoutMs, done] = arguments;
+const alerts = window.__alerts;
+if (!alerts) {
+    done([]);
+    return;
+}
+const deadline = setTimeout(() => {
+    // A waiter left behind would take the messages of the next alert for this finished call.
+    const index = alerts.waiters.indexOf(check);
+    if (index !== -1) {
+        alerts.waiters.splice(index, 1);
+    }
+    done(alerts.queue.splice(0));
+}, timeoutMs);
+const check = () => {
+    if (alerts.queue.length >= count) {
+        clearTimeout(deadline);
+        done(alerts.queue.splice(0));
+    } else {
+        alerts.waiters.push(check);
+    }
+};
+check();
+"""
+
+
+def install_alert_capture(driver: WebDriver) -> str:
+    """Replace ``window.alert`` in every document the current tab loads from now on.
+
+    Returns the identifier ``support.devtools.remove_document_script`` needs
+    to remove the stub again.
+    """
+    return add_document_script(driver, ALERT_STUB)
+
+
+def drain_alerts(driver: WebDriver) -> list[str]:
+    """Return and forget every message captured so far, without waiting."""
+    return driver.execute_script(DRAIN_SCRIPT)
+
+
+def wait_for_alerts(driver: WebDriver, count: int = 1, timeout_ms: int = ALERT_TIMEOUT_MS) -> list[str]:
+    """Wait until at least ``count`` messages were captured and return all of them."""
+    messages = driver.execute_async_script(WAIT_SCRIPT, count, timeout_ms)
+    if len(messages) < count:
+        raise NoAlertPresentException(f"expected {count} alert(s) within {timeout_ms} ms, got {messages!r}")
+    return messages
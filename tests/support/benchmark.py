@@ -0,0 +1,220 @@
+"""Benchmark of the UI suite's building blocks with regression detection.
+
+A fixed set of scenarios taken from TC-001..TC-015 is run ``--runs`` times.
+Each scenario opens the app, selects an account, types a card and an
+amount, reads the commission and, where the case allows it, sends the
+transfer. Browser startup, page load, every action's round trip and the
+wall time of each run are recorded and summarised as percentiles.
+
+The summary is compared with a committed baseline; the benchmark fails
+when a metric's median is slower than the baseline by more than
+``--max-slowdown``. ``--update-baseline`` records a new baseline instead.
+A missing baseline only warns locally but fails under CI (``CI`` set, as
+on GitHub Actions) or with ``--require-baseline``, so that the gate
+cannot pass silently.
+
+Usage (from the ``tests`` directory)::
+
+    python -m support.benchmark --runs 5
+    python -m support.benchmark --runs 10 --update-baseline
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+BASELINE_FILE = TESTS_DIR / "benchmarks" / "baseline.json"
+
+# Differences below this many milliseconds are noise, whatever the ratio.
+NOISE_FLOOR_MS = 5.0
+PERCENTILES = (50, 90, 95)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    balance: int
+    reserved: int
+    account: str
+    card: str
+    amount: str
+    send: bool
+
+
+SCENARIOS = (
+    Scenario("tc_002_rub_transfer", 33000, 1000, "rub", "4111111111111111", "1000", send=True),
+    Scenario("tc_003_usd_overdraft", 33000, 1000, "usd", "4000123456789000", "3111", send=False),
+    Scenario("tc_004_commission_floor", 33000, 1000, "rub", "1234567890901122", "99", send=False),
+    Scenario("tc_005_card_length", 33000, 1000, "rub", "5559000000000000", "1000", send=False),
+    Scenario("tc_011_exact_balance", 1100, 0, "rub", "5559000000000000", "1000", send=True),
+    Scenario("tc_012_amount_with_comma", 10000, 0, "rub", "5559000000000000", "1234,56", send=True),
+)
+
+
+@contextlib.contextmanager
+def measure(samples: dict[str, list[float]], metric: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        samples[metric].append((time.perf_counter() - started) * 1000)
+
+
+def run_scenario(page, scenario: Scenario, samples: dict[str, list[float]]):
+    from support.waits import wait_until_settled
+
+    with measure(samples, "page_load"):
+        page.open(scenario.balance, scenario.reserved)
+        wait_until_settled(page.driver)
+    with measure(samples, "select_account"):
+        page.select_account(scenario.account)
+    with measure(samples, "card_input"):
+        page.card_input(scenario.card, clear=True)
+    with measure(samples, "amount_input"):
+        page.amount_input(scenario.amount)
+    with measure(samples, "read_commission"):
+        page.commission()
+    with measure(samples, "send_button"):
+        button = page.send_button()
+    if scenario.send and button is not None:
+        with measure(samples, "send_and_alert"):
+            button.click()
+            page.accept_alert()
+
+
+def run_once(samples: dict[str, list[float]]):
+    """One run: a fresh browser going through every scenario."""
+    from support.drivers import create_driver
+    from support.pages import TransferPage
+    from support.session import discard
+
+    started = time.perf_counter()
+    with measure(samples, "browser_startup"):
+        driver = create_driver()
+    try:
+        page = TransferPage(driver)
+        for scenario in SCENARIOS:
+            with measure(samples, f"scenario.{scenario.name}"):
+                run_scenario(page, scenario, samples)
+    finally:
+        discard(driver)
+    samples["run_wall_time"].append((time.perf_counter() - started) * 1000)
+
+
+def percentile(values: list[float], rank: float) -> float:
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * rank / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(samples: dict[str, list[float]]) -> dict[str, dict[str, float]]:
+    summary = {}
+    for metric, values in sorted(samples.items()):
+        stats = {f"p{rank}": percentile(values, rank) for rank in PERCENTILES}
+        stats["max"] = max(values)
+        stats["count"] = len(values)
+        summary[metric] = stats
+    return summary
+
+
+def compare(summary: dict, baseline: dict, max_slowdown: float) -> list[str]:
+    """List every metric whose median regressed beyond ``max_slowdown``."""
+    regressions = []
+    for metric, stats in summary.items():
+        reference = baseline.get(metric)
+        if reference is None:
+            continue
+        limit = max(reference["p50"] * (1 + max_slowdown), reference["p50"] + NOISE_FLOOR_MS)
+        if stats["p50"] > limit:
+            regressions.append(
+                f"{metric}: p50 {stats['p50']:.1f} ms > {limit:.1f} ms (baseline {reference['p50']:.1f} ms)"
+            )
+    return regressions
+
+
+def print_summary(summary: dict, baseline: dict, stream=sys.stderr):
+    stream.write(f"{'metric':<36}{'p50':>10}{'p90':>10}{'p95':>10}{'max':>10}{'baseline':>11}\n")
+    for metric, stats in summary.items():
+        reference = baseline.get(metric, {}).get("p50")
+        reference_text = f"{reference:.1f}" if reference is not None else "-"
+        stream.write(
+            f"{metric:<36}{stats['p50']:>10.1f}{stats['p90']:>10.1f}{stats['p95']:>10.1f}"
+            f"{stats['max']:>10.1f}{reference_text:>11}\n"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--max-slowdown", type=float, default=0.25, help="allowed median slowdown, 0.25 = 25%%")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--output", type=Path, help="write this run's summary as JSON")
+    parser.add_argument(
+        "--require-baseline",
+        action=argparse.BooleanOptionalAction,
+        default=bool(os.environ.get("CI")),
+        help="fail when there is no baseline to compare with (default: on under CI)",
+    )
+    return parser.parse_args(argv)
+
+
+def judge(result: dict, args: argparse.Namespace) -> int:
+    """Record or check the baseline for this run's ``result``; returns the exit status."""
+    summary, profile = result["metrics"], result["profile"]
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print_summary(summary, summary)
+        sys.stderr.write(f"\nBaseline written to {args.baseline}\n")
+        return 0
+
+    if not args.baseline.exists():
+        print_summary(summary, {})
+        sys.stderr.write(f"\nNo baseline at {args.baseline}; record one with --update-baseline\n")
+        return 1 if args.require_baseline else 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("profile") != profile:
+        sys.stderr.write(f"Warning: baseline was recorded with the {baseline.get('profile')!r} profile\n")
+    print_summary(summary, baseline["metrics"])
+    regressions = compare(summary, baseline["metrics"], args.max_slowdown)
+    if regressions:
+        sys.stderr.write("\nRegressions:\n" + "".join(f"  {line}\n" for line in regressions))
+        return 1
+    sys.stderr.write("\nNo regressions\n")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    from support.interception import serve_app
+
+    with serve_app() as base_url:
+        # Must be set before support.config is imported by the helpers below.
+        os.environ["APP_BASE_URL"] = base_url
+        samples = defaultdict(list)
+        for _ in range(args.runs):
+            run_once(samples)
+
+    from support.config import BROWSER_PROFILE
+
+    summary = summarize(samples)
+    result = {"runs": args.runs, "profile": BROWSER_PROFILE, "metrics": summary}
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return judge(result, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
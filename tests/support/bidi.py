@@ -0,0 +1,378 @@
+"""Async WebDriver BiDi client on trio-websocket.
+
+The classic WebDriver HTTP API sends one blocking command at a time and
+learns about dialogs or DOM changes only by polling. Over the session's
+BiDi websocket (``webSocketUrl`` capability) commands are pipelined - any
+number can be in flight, matched to responses by id - and the browser
+pushes events such as ``browsingContext.userPromptOpened`` or
+``script.message``. One trio task per browsing context lets a single
+process drive many tabs concurrently.
+
+Nothing is polled: a preload script (``STATE_REPORTER``) watches every
+page with a ``MutationObserver`` and pushes the rendered accounts and the
+commission to a ``script.message`` channel, and dialogs arrive as
+``userPromptOpened`` events. Every command and every wait for an event is
+bounded by a timeout, so a page that never renders or never raises its
+alert fails the test with ``trio.TooSlowError`` instead of hanging it.
+
+``BidiTestCase`` keeps this usable from unittest classes: ``self.run_bidi``
+connects to the worker's BiDi-enabled session and runs an async function
+to completion with ``trio.run``.
+"""
+import contextlib
+import functools
+import itertools
+import json
+import math
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+
+import trio
+from trio_websocket import open_websocket_url
+
+from support.config import BASE_URL
+from support.drivers import create_driver
+from support.inputs import FILL_JS
+from support.pages import LOCATORS
+from support.session import BrowserTestCase, SessionPool
+
+
+MAX_MESSAGE_SIZE = 2 ** 24
+COMMAND_TIMEOUT_S = 60
+EVENT_TIMEOUT_S = 10
+STATE_CHANNEL = "transfer-state"
+
+T = TypeVar("T")
+
+
+class BidiError(Exception):
+    def __init__(self, error: str, message: str):
+        super().__init__(f"{error}: {message}")
+        self.error = error
+
+
+def serialize(value: Any) -> dict:
+    """Encode a Python value as a BiDi ``LocalValue``."""
+    if value is None:
+        return {"type": "null"}
+    if isinstance(value, bool):
+        return {"type": "boolean", "value": value}
+    if isinstance(value, (int, float)):
+        return {"type": "number", "value": value}
+    if isinstance(value, str):
+        return {"type": "string", "value": value}
+    if isinstance(value, (list, tuple)):
+        return {"type": "array", "value": [serialize(item) for item in value]}
+    if isinstance(value, dict):
+        return {"type": "object", "value": [[key, serialize(item)] for key, item in value.items()]}
+    raise TypeError(f"cannot pass {type(value).__name__} to the page")
+
+
+def deserialize(remote: dict) -> Any:
+    """Decode a BiDi ``RemoteValue``; nodes and other handles are returned as-is."""
+    kind = remote.get("type")
+    if kind in ("undefined", "null"):
+        return None
+    if kind in ("string", "boolean"):
+        return remote["value"]
+    if kind == "number":
+        value = remote["value"]
+        return {"NaN": math.nan, "Infinity": math.inf, "-Infinity": -math.inf, "-0": -0.0}.get(value, value)
+    if kind in ("array", "set"):
+        return [deserialize(item) for item in remote.get("value", [])]
+    if kind in ("object", "map"):
+        return {key if isinstance(key, str) else deserialize(key): deserialize(item)
+                for key, item in remote.get("value", [])}
+    return remote
+
+
+class BidiClient:
+    def __init__(self, websocket):
+        self._websocket = websocket
+        self._ids = itertools.count(1)
+        self._pending: dict[int, trio.MemorySendChannel] = {}
+        self._subscribers: dict[str, list[trio.MemorySendChannel]] = {}
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def connect(cls, url: str) -> AsyncIterator["BidiClient"]:
+        async with open_websocket_url(url, max_message_size=MAX_MESSAGE_SIZE) as websocket:
+            async with trio.open_nursery() as nursery:
+                client = cls(websocket)
+                nursery.start_soon(client._read_messages)
+                try:
+                    yield client
+                finally:
+                    nursery.cancel_scope.cancel()
+
+    async def _read_messages(self):
+        while True:
+            message = json.loads(await self._websocket.get_message())
+            if "id" in message:
+                channel = self._pending.pop(message["id"], None)
+                if channel is not None:
+                    channel.send_nowait(message)
+            elif message.get("type") == "event":
+                for channel in self._subscribers.get(message["method"], []):
+                    channel.send_nowait(message["params"])
+
+    async def execute(self, method: str, params: dict | None = None, timeout: float = COMMAND_TIMEOUT_S) -> dict:
+        """Send one command and wait for its result; other commands may run meanwhile."""
+        command_id = next(self._ids)
+        send_channel, receive_channel = trio.open_memory_channel(1)
+        self._pending[command_id] = send_channel
+        try:
+            with trio.fail_after(timeout):
+                await self._websocket.send_message(
+                    json.dumps({"id": command_id, "method": method, "params": params or {}})
+                )
+                response = await receive_channel.receive()
+        finally:
+            self._pending.pop(command_id, None)
+        if response.get("type") == "error":
+            raise BidiError(response["error"], response.get("message", ""))
+        return response["result"]
+
+    @contextlib.asynccontextmanager
+    async def events(self, *names: str) -> AsyncIterator[trio.MemoryReceiveChannel]:
+        """Subscribe to ``names`` and yield a channel receiving their params as pushed."""
+        send_channel, receive_channel = trio.open_memory_channel(math.inf)
+        for name in names:
+            self._subscribers.setdefault(name, []).append(send_channel)
+        subscription = await self.execute("session.subscribe", {"events": list(names)})
+        try:
+            yield receive_channel
+        finally:
+            for name in names:
+                self._subscribers[name].remove(send_channel)
+            with trio.CancelScope(shield=True):
+                if "subscription" in subscription:
+                    await self.execute("session.unsubscribe", {"subscriptions": [subscription["subscription"]]})
+                else:
+                    await self.execute("session.unsubscribe", {"events": list(names)})
+
+    async def new_context(self, kind: str = "tab") -> "BrowsingContext":
+        result = await self.execute("browsingContext.create", {"type": kind})
+        return BrowsingContext(self, result["context"])
+
+
+class BrowsingContext:
+    """One tab, addressed by its BiDi context id."""
+
+    def __init__(self, client: BidiClient, context_id: str):
+        self.client = client
+        self.id = context_id
+
+    async def navigate(self, url: str, wait: str = "interactive"):
+        await self.client.execute("browsingContext.navigate", {"context": self.id, "url": url, "wait": wait})
+
+    async def call(self, function_declaration: str, *args: Any) -> Any:
+        """Call a JS function in the page with JSON-like ``args``; promises are awaited."""
+        result = await self.client.execute("script.callFunction", {
+            "functionDeclaration": function_declaration,
+            "arguments": [serialize(arg) for arg in args],
+            "target": {"context": self.id},
+            "awaitPromise": True,
+        })
+        if result["type"] == "exception":
+            raise BidiError("javascript error", result["exceptionDetails"]["text"])
+        return deserialize(result["result"])
+
+    async def handle_prompt(self, accept: bool = True):
+        await self.client.execute("browsingContext.handleUserPrompt", {"context": self.id, "accept": accept})
+
+    async def close(self):
+        await self.client.execute("browsingContext.close", {"context": self.id})
+
+
+# Runs in every new document; ``send`` is the STATE_CHANNEL channel. A report
+# with a reason other than "change" is pushed even if nothing changed.
+STATE_REPORTER = """
+(send) => {
+    const text = (id) => {
+        const element = document.getElementById(id);
+        return element ? element.textContent : null;
+    };
+    let last = null;
+    const report = (reason) => {
+        const state = {
+            accounts: Array.from(document.querySelectorAll('[id$="-sum"]'), (element) => element.id.slice(0, -4)),
+            commission: text("comission"),
+        };
+        const key = JSON.stringify(state);
+        if (reason !== "change" || key !== last) {
+            last = key;
+            send({reason, ...state});
+        }
+    };
+    // From a timer, so that React has rendered what the caller's events changed.
+    Object.defineProperty(window, "__reportTransferState", {value: (reason) => setTimeout(() => report(reason), 0)});
+    new MutationObserver(() => report("change")).observe(document, {subtree: true, childList: true, characterData: true});
+}
+"""
+
+# React flushes updates from dispatched events asynchronously, hence the awaited ticks.
+FILL_TRANSFER_FUNCTION = """
+async (account, card, amount, cardSelector, amountSelector) => {
+""" + FILL_JS + """
+    const tick = () => new Promise((resolve) => setTimeout(resolve, 0));
+    const fill = async (field, text) => {
+        fillInput(field, text, false);
+        await tick();
+    };
+    document.getElementById(account + "-sum").click();
+    await tick();
+    await fill(document.querySelector(cardSelector), card);
+    const amountField = document.querySelector(amountSelector);
+    if (amountField) {
+        await fill(amountField, amount);
+    }
+    window.__reportTransferState("filled");
+}
+"""
+
+SEND_FUNCTION = """
+(buttonSelector) => {
+    const button = document.querySelector(buttonSelector);
+    if (!button) {
+        return false;
+    }
+    // Clicking from a timer lets this call return before the blocking alert opens.
+    setTimeout(() => button.click(), 0);
+    return true;
+}
+"""
+
+
+async def wait_for(
+    events: trio.MemoryReceiveChannel, predicate: Callable[[dict], bool], timeout: float = EVENT_TIMEOUT_S
+) -> dict:
+    """The first pushed event matching ``predicate``; ``trio.TooSlowError`` if none comes in time."""
+    with trio.fail_after(timeout):
+        async for event in events:
+            if predicate(event):
+                return event
+    raise trio.EndOfChannel("event stream closed")
+
+
+async def transfer_in_context(
+    context: BrowsingContext,
+    prompts: trio.MemoryReceiveChannel,
+    states: trio.MemoryReceiveChannel,
+    balance: int,
+    reserved: int,
+    card: str,
+    amount: str,
+    account: str = "rub",
+) -> dict:
+    """Open the app in ``context``, fill in a transfer, send it and wait for the pushed alert."""
+    await context.navigate(f"{BASE_URL}/?balance={balance}&reserved={reserved}")
+    await wait_for(states, lambda state: account in state["accounts"], COMMAND_TIMEOUT_S)
+    await context.call(
+        FILL_TRANSFER_FUNCTION, account, card, amount, LOCATORS["card_input"][1], LOCATORS["amount_input"][1]
+    )
+    filled = await wait_for(states, lambda state: state["reason"] == "filled")
+    sent = await context.call(SEND_FUNCTION, LOCATORS["send_button"][1])
+    message = None
+    if sent:
+        prompt = await wait_for(prompts, lambda prompt: True)
+        message = prompt["message"]
+        await context.handle_prompt()
+    return {"commission": filled["commission"], "sent": sent, "alert": message}
+
+
+def prompt_context(prompt: dict) -> str:
+    return prompt["context"]
+
+
+def state_context(message: dict) -> str | None:
+    return message["source"].get("context") if message["channel"] == STATE_CHANNEL else None
+
+
+class ContextRouter:
+    """Fans pushed events out to one channel per browsing context.
+
+    ``context_of`` names an event's context, or None to drop the event;
+    ``script.message`` events are replaced by their deserialized data.
+    """
+
+    def __init__(self, source: trio.MemoryReceiveChannel, context_of: Callable[[dict], str | None] = prompt_context):
+        self._source = source
+        self._context_of = context_of
+        self._channels: dict[str, trio.MemorySendChannel] = {}
+
+    def channel(self, context_id: str) -> trio.MemoryReceiveChannel:
+        send_channel, receive_channel = trio.open_memory_channel(math.inf)
+        self._channels[context_id] = send_channel
+        return receive_channel
+
+    async def run(self):
+        async for event in self._source:
+            channel = self._channels.get(self._context_of(event))
+            if channel is not None:
+                channel.send_nowait(deserialize(event["data"]) if "channel" in event else event)
+
+
+async def add_state_reporter(client: BidiClient) -> str:
+    """Install ``STATE_REPORTER`` in every document loaded from now on; returns the script id."""
+    result = await client.execute("script.addPreloadScript", {
+        "functionDeclaration": STATE_REPORTER,
+        "arguments": [{
+            "type": "channel",
+            "value": {"channel": STATE_CHANNEL, "serializationOptions": {"maxObjectDepth": 2}},
+        }],
+    })
+    return result["script"]
+
+
+async def run_transfers(client: BidiClient, transfers: list[dict]) -> list[dict]:
+    """Run every transfer in its own new tab, all concurrently."""
+    results: list[dict | None] = [None] * len(transfers)
+    async with (
+        client.events("browsingContext.userPromptOpened") as prompts,
+        client.events("script.message") as messages,
+    ):
+        prompt_router, state_router = ContextRouter(prompts), ContextRouter(messages, state_context)
+        reporter = await add_state_reporter(client)
+        try:
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(prompt_router.run)
+                nursery.start_soon(state_router.run)
+
+                async def run_one(index: int, transfer: dict):
+                    context = await client.new_context()
+                    try:
+                        results[index] = await transfer_in_context(
+                            context, prompt_router.channel(context.id), state_router.channel(context.id), **transfer
+                        )
+                    finally:
+                        with trio.CancelScope(shield=True):
+                            await context.close()
+
+                async with trio.open_nursery() as workers:
+                    for index, transfer in enumerate(transfers):
+                        workers.start_soon(run_one, index, transfer)
+                nursery.cancel_scope.cancel()
+        finally:
+            with trio.CancelScope(shield=True):
+                await client.execute("script.removePreloadScript", {"script": reporter})
+    return results
+
+
+bidi_session_pool = SessionPool(factory=functools.partial(create_driver, bidi=True))
+
+
+class BidiTestCase(BrowserTestCase):
+    """Browser test whose session also exposes a BiDi websocket."""
+
+    pool = bidi_session_pool
+
+    def run_bidi(self, function: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """Run ``await function(client, *args)`` on a fresh BiDi connection."""
+        url = self.driver.capabilities["webSocketUrl"]
+
+        async def main():
+            async with BidiClient.connect(url) as client:
+                return await function(client, *args)
+
+        return trio.run(main)
@@ -0,0 +1,295 @@
+"""Scenario table compiled from the markdown test-case catalogs.
+
+The catalogs (``CATALOG_FILES``) are prose written by different people,
+so parsing is deliberately conservative. Every ``##``/``###`` heading
+starts a case, and labelled blocks (``**Предусловия:**``, ``- Шаги:``,
+``**Ожидаемый результат**:`` ...) are split out. The parser then picks
+the values the page can check:
+
+* account, balance and reserved from the preconditions;
+* the card and amount from the test data, falling back to the steps;
+* the commission (``Комиссия = 123 ₽``), whether the transfer is allowed,
+  a literal alert text in backticks and the balance after sending, all
+  from the expected result. "Баланс становится N" is the total balance;
+  a "новое значение" of the available ("доступный") balance is balance
+  minus reserved.
+
+A case that yields no amount, no card or no checkable expectation is kept
+with a ``skip_reason`` instead of being guessed at.
+
+Parsed tables are cached in ``CACHE_FILE``, keyed by the contents of the
+catalogs and of this parser.
+"""
+import hashlib
+import json
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+
+from support.oracle import FIXED_ACCOUNTS, Case
+from support.snapshot import PageSnapshot
+
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+REPOSITORY_DIR = TESTS_DIR.parent
+CATALOG_FILES = (
+    REPOSITORY_DIR / "kolegova.md",
+    REPOSITORY_DIR / "elisei.md",
+    REPOSITORY_DIR / "klosep.md",
+    REPOSITORY_DIR / "berezovskaia" / "test_cases.md",
+)
+CACHE_FILE = TESTS_DIR / ".catalog-cache.json"
+
+# Preconditions of cases that do not state them, and the card of cases that only say "enter a card".
+DEFAULT_BALANCE = 10000
+DEFAULT_RESERVED = 0
+DEFAULT_CARD = "5559000000000000"
+DEFAULT_AMOUNT = "1000"
+
+HEADING = re.compile(r"^#{2,3}\s+\**\s*(?:(TC-\d+)\s*—\s*|(\d+)\.\s*)?(.+?)\s*\**\s*$")
+LABELS = {
+    "Цель": "goal",
+    "Предусловия": "preconditions",
+    "Тестовые данные": "data",
+    "Шаги": "steps",
+    "Ожидаемый результат": "expected",
+    "Ожидаемо": "expected",
+}
+LABEL = re.compile(
+    r"^\s*(?:[-*]\s+)?\**\s*(" + "|".join(LABELS) + r")[^:*\n]*\**\s*:\s*\**\s*(.*)$"
+)
+SEPARATOR = re.compile(r"^\s*-{3,}\s*$")
+
+NUMBER = r"-?\d[\d   ]*(?:[.,]\d+)?"
+BALANCE = re.compile(r"баланс\w*\s*[:=]?\s*[`*]*\s*(≥\s*)?(" + NUMBER + r")", re.IGNORECASE)
+RESERVED = re.compile(r"резерв\w*\s*[:=]?\s*[`*]*\s*(" + NUMBER + r")", re.IGNORECASE)
+URL_PARAMETERS = re.compile(r"balance=(\d+)&reserved=(\d+)(?!\S*[%,!])")
+CARD = re.compile(r"(?<!\d)(\d{4}(?: \d{4}){2,3}|\d{12,19})(?!\d)")
+AMOUNT = re.compile(r"^[\s*|-]*Сумма(?: перевода| \d)?\s*[:|]\s*[`*]*\s*(" + NUMBER + r")", re.MULTILINE)
+AMOUNT_STEP = re.compile(r"Ввести(?: сумму)?\s*[`*]*\s*(" + NUMBER + r")\s*[`*]*\s*(?:[₽$€]|\\\$|\(|[`*]|$)")
+COMMISSION = re.compile(r"Комиссия\b[^.\n(]*?[=:]\s*[`*\s]*(\d[\d ]*)\s*[₽$€]")
+ALERT = re.compile(r"`(Перевод [^`]+)`")
+BALANCE_AFTER = re.compile(r"[Бб]аланс становится\D*?(\d[\d ]*)\s*[₽$€]")
+NEW_VALUE = re.compile(r"новое значение\D*?(\d[\d ]*)\s*[₽$€]")
+AVAILABLE = re.compile(r"доступн\w*\s+баланс", re.IGNORECASE)
+NOT_SHOWN = re.compile(r"ошибк\w* не (?:отображается|появляется)", re.IGNORECASE)
+REJECTED = re.compile(r"ошибк|недостаточно|неактивн|блокир", re.IGNORECASE)
+ACCEPTED = re.compile(r"успешно|проходит|выполняется|(?<!не)активн", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    id: str
+    title: str
+    source: str
+    account: str
+    balance: int
+    reserved: int
+    card: str
+    amount: str
+    commission: int | None = None
+    allowed: bool | None = None
+    alert: str | None = None
+    balance_after: int | None = None
+    available_after: int | None = None
+    skip_reason: str | None = None
+
+    @property
+    def sends(self) -> bool:
+        """Whether checking the case needs the transfer to be sent."""
+        return self.alert is not None or self.balance_after is not None or self.available_after is not None
+
+    def case(self) -> Case:
+        return Case(self.balance, self.reserved, self.account, self.card, self.amount)
+
+
+def split_cases(text: str) -> list[tuple[str | None, str | None, str, dict[str, str]]]:
+    """Split a catalog into ``(tc_id, number, title, blocks)`` per heading."""
+    cases = []
+    blocks = label = None
+    for line in text.splitlines():
+        heading = HEADING.match(line)
+        if heading:
+            blocks, label = {}, None
+            cases.append((heading.group(1), heading.group(2), heading.group(3).strip("* "), blocks))
+            continue
+        if blocks is None or SEPARATOR.match(line):
+            label = None
+            continue
+        labelled = LABEL.match(line)
+        if labelled:
+            label = LABELS[labelled.group(1)]
+            line = labelled.group(2)
+        if label is not None:
+            blocks[label] = (blocks.get(label, "") + "\n" + line).strip()
+    return cases
+
+
+def to_int(number: str) -> int:
+    return int(float(re.sub(r"\s", "", number).replace(",", ".")))
+
+
+def parse_account(text: str) -> str:
+    lowered = text.lower()
+    if "доллар" in lowered or "usd" in lowered or "$" in text:
+        return "usd"
+    if "евро" in lowered or "eur" in lowered or "€" in text:
+        return "euro"
+    return "rub"
+
+
+def parse_amount(blocks: dict[str, str], title: str) -> str | None:
+    matches = AMOUNT.findall(blocks.get("data", "")) or [
+        # "Ввести 12345678901234567" is a card number, not an amount.
+        match for match in AMOUNT_STEP.findall(blocks.get("steps", "")) if not CARD.fullmatch(match.strip())
+    ]
+    if not matches:
+        return None
+    # The last amount is the one the expected result refers to (TC-001 changes it after a transfer).
+    amount = matches[-1].strip()
+    # Spaces are thousand separators in the prose, unless typing them is the point of the case.
+    return amount if "пробел" in title.lower() else re.sub(r"\s", "", amount)
+
+
+def parse_card(blocks: dict[str, str]) -> str | None:
+    for block in ("data", "steps"):
+        match = CARD.search(blocks.get(block, ""))
+        if match:
+            return match.group(1).replace(" ", "")
+    return None
+
+
+def parse_allowed(expected: str) -> bool | None:
+    expected = NOT_SHOWN.sub("", expected)
+    rejected, accepted = bool(REJECTED.search(expected)), bool(ACCEPTED.search(expected))
+    # Conditional expectations ("if not 16 digits - an error, if 16 - the button is active") are ambiguous.
+    return None if rejected == accepted else accepted
+
+
+def catalog_name(source: str) -> str:
+    """``kolegova`` for ``kolegova.md``, ``berezovskaia`` for ``berezovskaia/test_cases.md``."""
+    path = Path(source)
+    return path.parent.name if path.stem == "test_cases" else path.stem
+
+
+def parse_case(source: str, tc_id: str | None, number: str | None, title: str, blocks: dict[str, str]) -> Scenario:
+    preconditions = blocks.get("preconditions", "")
+    account = parse_account(preconditions + " " + blocks.get("steps", "") + " " + title)
+    balance, reserved = DEFAULT_BALANCE, DEFAULT_RESERVED
+    if account not in FIXED_ACCOUNTS:
+        url = URL_PARAMETERS.search(preconditions + " " + blocks.get("steps", ""))
+        stated_balance, stated_reserved = BALANCE.search(preconditions), RESERVED.search(preconditions)
+        if url:
+            balance, reserved = int(url.group(1)), int(url.group(2))
+        elif stated_balance:
+            # "Баланс ≥ N" only bounds the balance from below.
+            at_least, value = stated_balance.groups()
+            balance = max(to_int(value), DEFAULT_BALANCE) if at_least else to_int(value)
+            reserved = to_int(stated_reserved.group(1)) if stated_reserved else DEFAULT_RESERVED
+
+    expected = blocks.get("expected", "")
+    commission = COMMISSION.search(expected)
+    alert = ALERT.search(expected)
+    balance_after = BALANCE_AFTER.search(expected)
+    available_after = None
+    new_value = NEW_VALUE.search(expected)
+    if new_value and AVAILABLE.search(blocks.get("steps", "") + " " + expected):
+        available_after = new_value
+    elif new_value and balance_after is None:
+        balance_after = new_value
+    card, amount = parse_card(blocks), parse_amount(blocks, title)
+    scenario = Scenario(
+        id=tc_id or f"{catalog_name(source)}-{number}",
+        title=title,
+        source=source,
+        account=account,
+        balance=balance,
+        reserved=reserved,
+        card=card or DEFAULT_CARD,
+        amount=amount or DEFAULT_AMOUNT,
+        commission=to_int(commission.group(1)) if commission else None,
+        allowed=parse_allowed(expected),
+        alert=alert.group(1) if alert else None,
+        balance_after=to_int(balance_after.group(1)) if balance_after else None,
+        available_after=to_int(available_after.group(1)) if available_after else None,
+    )
+    skip_reason = None
+    if card is None and amount is None:
+        skip_reason = "no card or amount in the test data"
+    elif scenario.commission is None and scenario.allowed is None and not scenario.sends:
+        skip_reason = "no machine-checkable expected result"
+    return replace(scenario, skip_reason=skip_reason)
+
+
+def parse_catalog(path: Path) -> list[Scenario]:
+    source = path.relative_to(REPOSITORY_DIR).as_posix() if path.is_relative_to(REPOSITORY_DIR) else path.name
+    return [parse_case(source, *case) for case in split_cases(path.read_text(encoding="utf-8"))]
+
+
+def catalog_digest(paths: Iterable[Path]) -> str:
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def load_scenarios(paths: Iterable[Path] = CATALOG_FILES, cache_file: Path | None = CACHE_FILE) -> list[Scenario]:
+    """Every scenario of ``paths``, from ``cache_file`` while the catalogs are unchanged."""
+    paths = list(paths)
+    key = catalog_digest(paths)
+    if cache_file is not None:
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if cached["key"] == key:
+                return [Scenario(**item) for item in cached["scenarios"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    scenarios = [scenario for path in paths for scenario in parse_catalog(path)]
+    if cache_file is not None:
+        payload = {"key": key, "scenarios": [asdict(scenario) for scenario in scenarios]}
+        cache_file.write_text(json.dumps(payload, indent=1, ensure_ascii=False), encoding="utf-8")
+    return scenarios
+
+
+def group_scenarios(scenarios: Iterable[Scenario]) -> dict[tuple[int, int], list[Scenario]]:
+    """Scenarios by ``(balance, reserved)``, i.e. by the page they can share."""
+    groups = defaultdict(list)
+    for scenario in scenarios:
+        groups[scenario.balance, scenario.reserved].append(scenario)
+    return dict(groups)
+
+
+def compare_snapshot(scenario: Scenario, snapshot: PageSnapshot) -> list[str]:
+    """How the screen after filling in the transfer disagrees with ``scenario``."""
+    mismatches = []
+    if scenario.commission is not None and snapshot.commission != str(scenario.commission):
+        mismatches.append(f"commission {snapshot.commission!r}, expected {scenario.commission}")
+    if scenario.allowed is not None and snapshot.send_button != scenario.allowed:
+        verb = "shown" if snapshot.send_button else "hidden"
+        mismatches.append(f"send button {verb}, expected allowed={scenario.allowed}")
+    if scenario.allowed and snapshot.error is not None:
+        mismatches.append(f"error {snapshot.error!r} shown for an allowed transfer")
+    return mismatches
+
+
+def compare_sent(scenario: Scenario, alert: str | None, balance: str, reserved: str) -> list[str]:
+    """How the alert and the balance and reserved shown after sending disagree with ``scenario``."""
+    mismatches = []
+    if scenario.alert is not None and alert != scenario.alert:
+        mismatches.append(f"alert {alert!r}, expected {scenario.alert!r}")
+    if scenario.balance_after is not None and balance != str(scenario.balance_after):
+        mismatches.append(f"balance {balance!r} after sending, expected {scenario.balance_after}")
+    if scenario.available_after is not None:
+        try:
+            available = str(to_int(balance) - to_int(reserved))
+        except ValueError:
+            available = None
+        if available != str(scenario.available_after):
+            mismatches.append(
+                f"available {available} (balance {balance!r}, reserved {reserved!r}) after sending,"
+                f" expected {scenario.available_after}"
+            )
+    return mismatches
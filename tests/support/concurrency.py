@@ -0,0 +1,178 @@
+"""Harness for transfers submitted concurrently from several tabs or sessions.
+
+Every tab (or browser session) opens the same ``?balance=&reserved=`` URL
+and fills in its own transfer. Alerts are captured in-page (see
+``support.alerts``) so that a send never blocks the other tabs. The sends
+are then fired:
+
+* ``run_in_tabs`` - tabs of one session, in an explicit interleaving
+  ``order``, one script round trip per send;
+* ``run_in_sessions`` - separate browsers driven from threads that are
+  released together by a barrier, for truly simultaneous submissions.
+
+Each tab reports when its send fired (browser clock, ms since epoch), the
+alerts it showed and a snapshot of the screen afterwards.
+"""
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.alerts import drain_alerts, install_alert_capture
+from support.devtools import remove_document_script
+from support.pages import LOCATORS, TransferPage
+from support.session import discard
+from support.snapshot import PageSnapshot, take_snapshot
+from support.waits import wait_until_settled
+
+
+SETTLE_AFTER_SEND_S = 0.2
+# How long the first prepared session waits for the others to start and fill in their transfer.
+BARRIER_TIMEOUT_S = 60
+
+FIRE_SCRIPT = """
+const button = document.querySelector(arguments[0]);
+if (!button) {
+    return null;
+}
+const firedAt = performance.timeOrigin + performance.now();
+button.click();
+return firedAt;
+"""
+
+
+@dataclass(frozen=True)
+class Transfer:
+    card: str
+    amount: str
+    account: str = "rub"
+
+
+@dataclass(frozen=True)
+class TransferOutcome:
+    tab: int
+    transfer: Transfer
+    fired_at_ms: float | None
+    alerts: list[str]
+    snapshot: PageSnapshot
+
+    @property
+    def accepted(self) -> bool:
+        return any("принят" in alert.lower() for alert in self.alerts)
+
+
+@dataclass(frozen=True)
+class ConcurrentRun:
+    outcomes: list[TransferOutcome]
+    elapsed_s: float
+
+    @property
+    def fire_spread_ms(self) -> float | None:
+        """Time between the first and the last send that actually fired."""
+        fired = [outcome.fired_at_ms for outcome in self.outcomes if outcome.fired_at_ms is not None]
+        return max(fired) - min(fired) if fired else None
+
+
+def prepare(driver: WebDriver, url: str, transfer: Transfer) -> TransferPage:
+    driver.get(url)
+    page = TransferPage(driver)
+    page.select_account(transfer.account)
+    page.card_input(transfer.card, clear=True)
+    page.amount_input(transfer.amount)
+    wait_until_settled(driver)
+    return page
+
+
+def fire(driver: WebDriver) -> float | None:
+    return driver.execute_script(FIRE_SCRIPT, LOCATORS["send_button"][1])
+
+
+def collect(driver: WebDriver, tab: int, transfer: Transfer, fired_at_ms: float | None) -> TransferOutcome:
+    return TransferOutcome(
+        tab=tab,
+        transfer=transfer,
+        fired_at_ms=fired_at_ms,
+        alerts=drain_alerts(driver),
+        snapshot=take_snapshot(driver),
+    )
+
+
+def run_in_tabs(
+    driver: WebDriver, url: str, transfers: list[Transfer], order: list[int] | None = None
+) -> ConcurrentRun:
+    """Prepare one tab per transfer, then fire the sends in ``order`` (tab indices).
+
+    Extra tabs are left open; the session pool closes them on reset.
+    """
+    order = list(range(len(transfers))) if order is None else order
+    main_window = driver.current_window_handle
+    handles = [main_window]
+    for _ in transfers[1:]:
+        driver.switch_to.new_window("tab")
+        handles.append(driver.current_window_handle)
+
+    stubs = {}
+    try:
+        for handle, transfer in zip(handles, transfers):
+            driver.switch_to.window(handle)
+            stubs[handle] = install_alert_capture(driver)
+            prepare(driver, url, transfer)
+
+        started = time.perf_counter()
+        fired_at = {}
+        for tab in order:
+            driver.switch_to.window(handles[tab])
+            fired_at[tab] = fire(driver)
+        elapsed = time.perf_counter() - started
+        time.sleep(SETTLE_AFTER_SEND_S)
+
+        outcomes = []
+        for tab, (handle, transfer) in enumerate(zip(handles, transfers)):
+            driver.switch_to.window(handle)
+            outcomes.append(collect(driver, tab, transfer, fired_at.get(tab)))
+    finally:
+        # The main tab belongs to the pooled session, whose reset keeps new-document scripts.
+        for handle, identifier in stubs.items():
+            driver.switch_to.window(handle)
+            remove_document_script(driver, identifier)
+        driver.switch_to.window(main_window)
+    return ConcurrentRun(outcomes=outcomes, elapsed_s=elapsed)
+
+
+def run_in_sessions(factory: Callable[[], WebDriver], url: str, transfers: list[Transfer]) -> ConcurrentRun:
+    """Drive one fresh browser per transfer and release all sends at the same moment."""
+    barrier = threading.Barrier(len(transfers), timeout=BARRIER_TIMEOUT_S)
+    fire_spans: list[tuple[float, float]] = []
+
+    def drive(tab: int, transfer: Transfer) -> TransferOutcome:
+        driver = None
+        try:
+            driver = factory()
+            install_alert_capture(driver)
+            prepare(driver, url, transfer)
+            barrier.wait()
+            started = time.perf_counter()
+            fired_at_ms = fire(driver)
+            fire_spans.append((started, time.perf_counter()))
+            time.sleep(SETTLE_AFTER_SEND_S)
+            return collect(driver, tab, transfer, fired_at_ms)
+        except Exception:
+            # Release the other threads instead of leaving them at the barrier.
+            barrier.abort()
+            raise
+        finally:
+            if driver is not None:
+                discard(driver)
+
+    with ThreadPoolExecutor(max_workers=len(transfers)) as executor:
+        futures = [executor.submit(drive, tab, transfer) for tab, transfer in enumerate(transfers)]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    if errors:
+        # The other threads only saw the aborted barrier; report what broke it.
+        raise next((error for error in errors if not isinstance(error, threading.BrokenBarrierError)), errors[0])
+    outcomes = [future.result() for future in futures]
+    elapsed = max(end for _, end in fire_spans) - min(start for start, _ in fire_spans)
+    return ConcurrentRun(outcomes=outcomes, elapsed_s=elapsed)
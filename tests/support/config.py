@@ -0,0 +1,36 @@
+import os
+from pathlib import Path
+
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+
+# "http" opens the app from a server, "memory" from dist/ held in the browser's DevTools hooks (see support.interception)
+SERVE_MODE = os.environ.get("SERVE_MODE", "http")
+
+BASE_URL = os.environ.get(
+    "APP_BASE_URL", "http://dist.localhost" if SERVE_MODE == "memory" else "http://localhost:8000"
+).rstrip("/")
+
+# "dialog" keeps the app's real window.alert, "capture" records messages in-page (see support.alerts)
+ALERT_MODE = os.environ.get("ALERT_MODE", "dialog")
+
+# "fast" sets input values in one script call, "keys" types them with send_keys (see support.inputs)
+INPUT_MODE = os.environ.get("INPUT_MODE", "fast")
+
+# named browser profile from support.drivers.PROFILES
+BROWSER_PROFILE = os.environ.get("BROWSER_PROFILE", "fast")
+
+# size and seed of the generated case set checked against support.oracle
+ORACLE_CASES = int(os.environ.get("ORACLE_CASES", "2000"))
+ORACLE_SEED = int(os.environ.get("ORACLE_SEED", "0"))
+
+# DevTools CPU slowdown factor for the responsiveness budgets (1 = no throttling)
+CPU_THROTTLE = float(os.environ.get("CPU_THROTTLE", "1"))
+
+# a warm browser above either limit after a test is recycled (see support.watchdog)
+MAX_BROWSER_RSS_MB = float(os.environ.get("MAX_BROWSER_RSS_MB", "1500"))
+MAX_JS_HEAP_MB = float(os.environ.get("MAX_JS_HEAP_MB", "200"))
+
+# where failed UI tests leave their flight record (see support.recorder); empty switches dumps off
+FLIGHT_DIR = os.environ.get("FLIGHT_DIR", str(TESTS_DIR / "flight-records"))
+FLIGHT_EVENTS = int(os.environ.get("FLIGHT_EVENTS", "200"))
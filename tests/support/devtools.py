@@ -0,0 +1,19 @@
+"""Scripts the browser runs in every new document, installed over DevTools.
+
+The alert capture (``support.alerts``), the flight recorder's page buffer
+(``support.recorder``) and the responsiveness probe (``support.perf``)
+must be in place before any page script runs, which only
+``Page.addScriptToEvaluateOnNewDocument`` guarantees. Such scripts stay
+installed on the session until removed, and ``SessionPool.reset`` does
+not remove them - whoever adds one to a pooled session removes it again.
+"""
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+def add_document_script(driver: WebDriver, source: str) -> str:
+    """Run ``source`` in every document the current tab loads from now on; returns its identifier."""
+    return driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})["identifier"]
+
+
+def remove_document_script(driver: WebDriver, identifier: str):
+    driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
@@ -0,0 +1,200 @@
+"""ChromeDriver resolution and the browser factory.
+
+The driver binary is resolved once per machine, not once per test.
+
+``ChromeDriverManager().install()`` resolves the driver version over the
+network every time it is called and fails on offline runners. The driver
+path is resolved in this order instead:
+
+1. ``CHROMEDRIVER_PATH`` environment variable - a local binary, no network;
+2. the on-disk cache, keyed by the installed Chrome version;
+3. ``ChromeDriverManager().install()``, whose result is written to the cache;
+4. a ``chromedriver`` found on ``PATH``.
+
+When Chrome's version cannot be detected the cache is neither read nor
+written - a driver cached under an unknown version would outlive the next
+Chrome upgrade.
+
+The result is also memoised for the lifetime of the process.
+
+Every test class starts the same browser, configured by a named profile
+selected with ``BROWSER_PROFILE``:
+
+* ``fast`` (default) - headless, eager page loads, no images, fonts or
+  extensions, a small fixed viewport and no implicit wait;
+* ``debug`` - a visible full-size window with normal page loads, for
+  watching a test run;
+* ``legacy`` - the options the test classes used to build in ``setUp``.
+"""
+import functools
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver import ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.remote.webdriver import WebDriver
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+from support.alerts import install_alert_capture
+from support.config import ALERT_MODE, BROWSER_PROFILE, FLIGHT_DIR, SERVE_MODE
+from support.interception import serve_from_memory
+from support.recorder import install_page_recorder
+from support.tracing import tracer
+from support.watchdog import watchdog
+
+
+CACHE_DIR = Path(os.environ.get("DRIVER_CACHE_DIR", Path.home() / ".cache" / "qa-final-homework"))
+CACHE_FILE = CACHE_DIR / "chromedriver.json"
+
+
+def installed_chrome_version() -> str | None:
+    """Ask the local Chrome binary for its version; never touches the network."""
+    for chrome_type in (ChromeType.GOOGLE, ChromeType.CHROMIUM):
+        try:
+            version = OperationSystemManager().get_browser_version_from_os(chrome_type)
+        except Exception:
+            version = None
+        if version:
+            return version
+    return None
+
+
+def read_cache() -> dict[str, str]:
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_cache(chrome_version: str, driver_path: str):
+    cache = read_cache()
+    cache[chrome_version] = driver_path
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    tmp_file.replace(CACHE_FILE)
+
+
+@functools.cache
+def chromedriver_path() -> str:
+    configured_path = os.environ.get("CHROMEDRIVER_PATH")
+    if configured_path:
+        return configured_path
+
+    chrome_version = installed_chrome_version()
+    cached_path = read_cache().get(chrome_version) if chrome_version else None
+    if cached_path and os.path.isfile(cached_path):
+        return cached_path
+
+    try:
+        driver_path = ChromeDriverManager().install()
+    except Exception:
+        driver_path = shutil.which("chromedriver")
+        if driver_path is None:
+            raise RuntimeError(
+                "ChromeDriver could not be downloaded and none was found on PATH; "
+                "set CHROMEDRIVER_PATH to a local chromedriver binary"
+            )
+        return driver_path
+
+    if chrome_version:
+        write_cache(chrome_version, driver_path)
+    return driver_path
+
+
+@dataclass(frozen=True)
+class BrowserProfile:
+    name: str
+    headless: bool
+    page_load_strategy: str
+    window_size: tuple[int, int]
+    block_resources: bool
+    arguments: tuple[str, ...] = ()
+
+
+COMMON_ARGUMENTS = ("--disable-infobars", "--no-sandbox", "--disable-dev-shm-usage")
+BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.woff", "*.woff2", "*.ttf", "*.otf"]
+
+PROFILES = {
+    "fast": BrowserProfile(
+        name="fast",
+        headless=True,
+        page_load_strategy="eager",
+        window_size=(1280, 800),
+        block_resources=True,
+        arguments=(
+            "--disable-extensions",
+            "--disable-gpu",
+            "--blink-settings=imagesEnabled=false",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--no-first-run",
+        ),
+    ),
+    "debug": BrowserProfile(
+        name="debug",
+        headless=False,
+        page_load_strategy="normal",
+        window_size=(1920, 1080),
+        block_resources=False,
+    ),
+    "legacy": BrowserProfile(
+        name="legacy",
+        headless=True,
+        page_load_strategy="normal",
+        window_size=(1920, 1080),
+        block_resources=False,
+    ),
+}
+
+
+def chrome_options(profile: BrowserProfile) -> ChromeOptions:
+    options = ChromeOptions()
+    options.page_load_strategy = profile.page_load_strategy
+    options.add_argument("--window-size={},{}".format(*profile.window_size))
+    if profile.headless:
+        options.add_argument("--headless=new")
+    for argument in COMMON_ARGUMENTS + profile.arguments:
+        options.add_argument(argument)
+    return options
+
+
+def create_driver(profile_name: str | None = None, bidi: bool = False) -> WebDriver:
+    """Start Chrome with the profile ``profile_name`` (``BROWSER_PROFILE`` by default).
+
+    ``bidi`` also requests a WebDriver BiDi websocket (see ``support.bidi``).
+    """
+    profile_name = profile_name or BROWSER_PROFILE
+    try:
+        profile = PROFILES[profile_name]
+    except KeyError:
+        raise ValueError(f"unknown browser profile {profile_name!r}, expected one of {sorted(PROFILES)}") from None
+
+    options = chrome_options(profile)
+    if bidi:
+        options.enable_bidi = True
+    service = ChromeService(executable_path=chromedriver_path())
+    driver = webdriver.Chrome(service=service, options=options)
+    watchdog.track(driver)
+    try:
+        tracer.instrument(driver)
+        driver.implicitly_wait(0)
+        if SERVE_MODE == "memory":
+            serve_from_memory(driver)
+        if profile.block_resources:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        if ALERT_MODE == "capture":
+            install_alert_capture(driver)
+        if FLIGHT_DIR:
+            install_page_recorder(driver)
+    except Exception:
+        # Nobody else holds this browser yet; do not leave it running.
+        driver.quit()
+        raise
+    return driver
@@ -0,0 +1,43 @@
+"""Fast text entry for the transfer form.
+
+``send_keys`` costs one synthetic key event per character, plus ``clear``
+and a ``get_attribute("value")`` round trip. In ``fast`` mode the whole
+value is set through the native ``HTMLInputElement`` setter (so React's
+value tracker notices the change), ``input``/``change`` events are
+dispatched, and the value formatted by the app's ``onChange`` handler is
+returned - all in one script call.
+
+Tests that exercise keystroke-level behaviour opt out with
+``@real_keystrokes``; ``INPUT_MODE=keys`` turns fast entry off globally.
+"""
+from selenium.webdriver.remote.webelement import WebElement
+
+
+# Replacing goes through "" first: React's value tracker ignores an input
+# event when the DOM already shows the new text, e.g. a remounted input
+# whose default value equals it while React state holds another amount.
+# Page scripts that fill the form themselves embed FILL_JS.
+FILL_JS = """
+function fillInput(field, text, append) {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+    for (const value of append ? [field.value + text] : ["", text]) {
+        setValue.call(field, value);
+        field.dispatchEvent(new Event("input", {bubbles: true}));
+    }
+    field.dispatchEvent(new Event("change", {bubbles: true}));
+    return field.value;
+}
+"""
+
+FILL_SCRIPT = FILL_JS + "return fillInput(...arguments);"
+
+
+def fill_fast(field: WebElement, text: str, append: bool = False) -> str:
+    """Set ``field`` to ``text`` (or append it) and return the resulting value."""
+    return field.parent.execute_script(FILL_SCRIPT, field, text, append)
+
+
+def real_keystrokes(test_method):
+    """Mark a test that must type with ``send_keys`` even in ``fast`` mode."""
+    test_method.real_keystrokes = True
+    return test_method
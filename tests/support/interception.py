@@ -0,0 +1,153 @@
+"""Serve ``dist/`` to the browser from memory, without an HTTP server.
+
+With ``SERVE_MODE=memory`` the app is opened at ``MEMORY_ORIGIN``, a host
+nothing listens on. Every request to that origin is paused by the
+DevTools ``Fetch`` domain and fulfilled from the worker's in-memory copy
+of ``dist/`` (the same ``Asset`` table ``support.server`` serves), so no
+socket, port or server process is involved.
+
+Paused requests arrive as events, which the Selenium command API cannot
+receive. ``MemoryOrigin`` therefore keeps its own DevTools connection to
+the browser on a daemon thread. It auto-attaches to every page, including
+tabs opened later. New targets are held until ``Fetch`` is enabled for
+them, so no request can slip past the interception.
+"""
+import base64
+import contextlib
+import functools
+import itertools
+import json
+import os
+import threading
+import urllib.request
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+import websocket
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.server import Asset, load_assets, serve_dist
+
+
+# Must match the default BASE_URL of support.config in memory mode.
+MEMORY_ORIGIN = "http://dist.localhost"
+ATTACH_TIMEOUT = 10
+
+
+@functools.cache
+def dist_assets() -> dict[str, Asset]:
+    """``dist/``, read once per worker process."""
+    return load_assets()
+
+
+def response_for(url: str, assets: dict[str, Asset]) -> dict:
+    """``Fetch.fulfillRequest`` parameters answering ``url``."""
+    asset = assets.get(urlsplit(url).path)
+    if asset is None:
+        body = HTTPStatus.NOT_FOUND.phrase.encode()
+        return {
+            "responseCode": HTTPStatus.NOT_FOUND,
+            "responseHeaders": [{"name": "Content-Type", "value": "text/plain; charset=utf-8"}],
+            "body": base64.b64encode(body).decode(),
+        }
+    return {
+        "responseCode": HTTPStatus.OK,
+        "responseHeaders": [
+            {"name": "Content-Type", "value": asset.content_type},
+            {"name": "Content-Length", "value": str(len(asset.body))},
+            {"name": "Cache-Control", "value": asset.cache_control},
+            {"name": "ETag", "value": asset.etag},
+        ],
+        "body": base64.b64encode(asset.body).decode(),
+    }
+
+
+class MemoryOrigin:
+    """Answers the browser's requests for ``origin`` from ``assets``."""
+
+    def __init__(self, debugger_address: str, assets: dict[str, Asset], origin: str = MEMORY_ORIGIN):
+        self.origin = origin
+        self.assets = assets
+        with urllib.request.urlopen(f"http://{debugger_address}/json/version", timeout=ATTACH_TIMEOUT) as response:
+            browser_url = json.load(response)["webSocketDebuggerUrl"]
+        self._websocket = websocket.create_connection(browser_url, timeout=None, suppress_origin=True)
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._pending: set[int] = set()
+        self._settled = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="memory-origin", daemon=True)
+
+    def start(self):
+        """Attach to the browser and wait until every open page is intercepted."""
+        self._thread.start()
+        self._send(
+            "Target.setAutoAttach",
+            {"autoAttach": True, "waitForDebuggerOnStart": True, "flatten": True},
+            track=True,
+        )
+        with self._settled:
+            if not self._settled.wait_for(lambda: not self._pending, ATTACH_TIMEOUT):
+                raise RuntimeError(f"DevTools did not confirm the interception of {self.origin}")
+
+    def close(self):
+        self._websocket.close()
+
+    def _send(self, method: str, params: dict, session_id: str | None = None, track: bool = False):
+        message = {"id": next(self._ids), "method": method, "params": params}
+        if session_id is not None:
+            message["sessionId"] = session_id
+        if track:
+            with self._settled:
+                self._pending.add(message["id"])
+        with self._send_lock:
+            self._websocket.send(json.dumps(message))
+
+    def _run(self):
+        try:
+            while True:
+                self._handle(json.loads(self._websocket.recv()))
+        except (websocket.WebSocketException, OSError, ValueError):
+            # The browser quit or close() was called.
+            pass
+
+    def _handle(self, message: dict):
+        if "id" in message:
+            with self._settled:
+                self._pending.discard(message["id"])
+                self._settled.notify_all()
+            return
+
+        method, params, session_id = message.get("method"), message.get("params", {}), message.get("sessionId")
+        if method == "Target.attachedToTarget":
+            attached = params["sessionId"]
+            if params["targetInfo"]["type"] == "page":
+                self._send(
+                    "Fetch.enable",
+                    {"patterns": [{"urlPattern": f"{self.origin}/*", "requestStage": "Request"}]},
+                    attached,
+                    track=True,
+                )
+            # Messages of one session are processed in order, so Fetch is on before the page runs.
+            self._send("Runtime.runIfWaitingForDebugger", {}, attached)
+        elif method == "Fetch.requestPaused":
+            response = response_for(params["request"]["url"], self.assets)
+            self._send("Fetch.fulfillRequest", {"requestId": params["requestId"], **response}, session_id)
+
+
+def serve_from_memory(driver: WebDriver) -> MemoryOrigin:
+    """Route ``MEMORY_ORIGIN`` in ``driver``'s browser to the in-memory ``dist/``."""
+    debugger_address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    origin = MemoryOrigin(debugger_address, dist_assets())
+    origin.start()
+    return origin
+
+
+def serve_app() -> contextlib.AbstractContextManager[str]:
+    """Context yielding the app's base URL for a worker: a started server, or nothing to start.
+
+    Reads ``SERVE_MODE`` itself - ``support.config`` must not be imported
+    before the caller has set ``APP_BASE_URL``.
+    """
+    if os.environ.get("SERVE_MODE", "http") == "memory":
+        return contextlib.nullcontext(MEMORY_ORIGIN)
+    return serve_dist()
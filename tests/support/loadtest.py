@@ -0,0 +1,302 @@
+"""Load generator for the server that hosts ``dist/``.
+
+One simulated page load replays what a browser fetches for the app:
+``/?balance=...&reserved=...`` (query strings rotate through ``QUERIES``),
+then every asset referenced by the returned ``index.html`` - the hashed
+JS and CSS - and ``/vite.svg``. ``--concurrency`` clients, each on its own
+keep-alive connection, repeat page loads for ``--duration`` seconds.
+With ``--rate`` the page loads are started on a fixed schedule (open
+loop), and latency is measured from the scheduled start so that a server
+falling behind shows up in the tail instead of silently lowering the
+load.
+
+The target is either a running server (``--url``) or servers started
+in-process for a side-by-side comparison: ``stdlib`` is what
+``python -m http.server`` runs, ``tuned`` is ``support.server``.
+
+Usage (from the ``tests`` directory)::
+
+    python -m support.loadtest --server stdlib --server tuned --concurrency 16 --duration 10
+    python -m support.loadtest --url http://localhost:8000 --rate 200
+"""
+import argparse
+import contextlib
+import functools
+import http.client
+import itertools
+import json
+import re
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from support.benchmark import percentile
+from support.server import DIST_DIR, POLL_INTERVAL, serve_dist
+
+
+QUERIES = (
+    "?balance=30000&reserved=20001",
+    "?balance=33000&reserved=1000",
+    "?balance=1100&reserved=0",
+    "?balance=&reserved=",
+)
+EXTRA_PATHS = ("/vite.svg",)
+ASSET_PATTERN = re.compile(r'(?:src|href)="(/[^"]+)"')
+# What Chrome sends for a first visit; the tuned server answers with a compressed body.
+REQUEST_HEADERS = {"Accept-Encoding": "gzip, deflate, br", "User-Agent": "qa-final-homework-loadtest"}
+REPORT_PERCENTILES = (50, 95, 99)
+CONNECT_TIMEOUT = 10
+
+
+@dataclass
+class LoadResult:
+    target: str
+    duration_s: float = 0.0
+    page_latencies_ms: list[float] = field(default_factory=list)
+    request_latencies_ms: dict[str, list[float]] = field(default_factory=dict)
+    bytes_received: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        pages = len(self.page_latencies_ms)
+        requests = sum(len(values) for values in self.request_latencies_ms.values())
+        summary = {
+            "target": self.target,
+            "pages": pages,
+            "requests": requests,
+            "errors": sum(self.errors.values()),
+            "pages_per_s": pages / self.duration_s if self.duration_s else 0.0,
+            "requests_per_s": requests / self.duration_s if self.duration_s else 0.0,
+            "mb_per_s": self.bytes_received / self.duration_s / 1e6 if self.duration_s else 0.0,
+            "page": latency_stats(self.page_latencies_ms),
+            "paths": {path: latency_stats(values) for path, values in sorted(self.request_latencies_ms.items())},
+        }
+        if self.errors:
+            summary["error_kinds"] = dict(self.errors)
+        return summary
+
+
+def latency_stats(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    stats = {f"p{rank}": percentile(values, rank) for rank in REPORT_PERCENTILES}
+    stats["max"] = max(values)
+    return stats
+
+
+def referenced_paths(index_html: str) -> list[str]:
+    """Paths of the assets ``index.html`` asks for, plus the ones fetched regardless."""
+    paths = list(dict.fromkeys(ASSET_PATTERN.findall(index_html)))
+    return paths + [path for path in EXTRA_PATHS if path not in paths]
+
+
+class Client:
+    """One keep-alive connection; reconnects when the server closes it.
+
+    ``paths`` are the assets fetched after the page itself.
+    """
+
+    def __init__(self, base_url: str, paths: list[str]):
+        self.paths = paths
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.connection = http.client.HTTPConnection(self.host, self.port, timeout=CONNECT_TIMEOUT)
+
+    def get(self, path: str) -> tuple[int, bytes]:
+        try:
+            return self._get(path)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server dropped an idle keep-alive connection; one retry on a new one.
+            self.connection.close()
+            return self._get(path)
+
+    def _get(self, path: str) -> tuple[int, bytes]:
+        self.connection.request("GET", path, headers=REQUEST_HEADERS)
+        response = self.connection.getresponse()
+        body = response.read()
+        if response.will_close:
+            self.connection.close()
+        return response.status, body
+
+    def close(self):
+        self.connection.close()
+
+
+class LoadError(Exception):
+    pass
+
+
+def page_load(client: Client, query: str, result: LoadResult, lock: threading.Lock) -> bool:
+    """Fetch the page and its assets in browser order; False if anything failed."""
+    timings = []
+    received = 0
+    try:
+        started = time.perf_counter()
+        status, body = client.get("/" + query)
+        timings.append(("/", (time.perf_counter() - started) * 1000))
+        received += len(body)
+        if status != 200:
+            raise LoadError(f"HTTP {status} for /")
+        for path in client.paths:
+            started = time.perf_counter()
+            status, body = client.get(path)
+            timings.append((path, (time.perf_counter() - started) * 1000))
+            received += len(body)
+            if status != 200:
+                raise LoadError(f"HTTP {status} for {path}")
+    except (OSError, http.client.HTTPException, LoadError) as error:
+        kind = str(error) if isinstance(error, LoadError) else type(error).__name__
+        client.close()
+        with lock:
+            result.errors[kind] = result.errors.get(kind, 0) + 1
+        return False
+    with lock:
+        for path, elapsed in timings:
+            result.request_latencies_ms.setdefault(path, []).append(elapsed)
+        result.bytes_received += received
+    return True
+
+
+def run_load(
+    base_url: str,
+    concurrency: int,
+    duration_s: float,
+    rate: float | None = None,
+    warmup_s: float = 1.0,
+) -> LoadResult:
+    """Load ``base_url`` for ``duration_s`` seconds after a ``warmup_s`` second warm-up."""
+    asset_paths = discover_paths(base_url)
+    result = LoadResult(target=base_url)
+    lock = threading.Lock()
+    schedule = itertools.count()
+    started = time.perf_counter()
+    measure_from = started + warmup_s
+    deadline = measure_from + duration_s
+
+    def worker(index: int):
+        client = Client(base_url, asset_paths)
+        iteration = 0
+        try:
+            while True:
+                if rate:
+                    with lock:
+                        slot = next(schedule)
+                    scheduled = started + slot / rate
+                    if scheduled >= deadline:
+                        return
+                    delay = scheduled - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                else:
+                    scheduled = time.perf_counter()
+                    if scheduled >= deadline:
+                        return
+                query = QUERIES[(index + iteration) % len(QUERIES)]
+                iteration += 1
+                measured = scheduled >= measure_from
+                target = result if measured else LoadResult(target=base_url)
+                if page_load(client, query, target, lock) and measured:
+                    with lock:
+                        result.page_latencies_ms.append((time.perf_counter() - scheduled) * 1000)
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=worker, args=(index,), daemon=True) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.duration_s = max(time.perf_counter(), deadline) - measure_from
+    return result
+
+
+def discover_paths(base_url: str) -> list[str]:
+    """Read ``index.html`` once, uncompressed, to learn the hashed asset names."""
+    parts = urlsplit(base_url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=CONNECT_TIMEOUT)
+    try:
+        connection.request("GET", "/")
+        response = connection.getresponse()
+        body = response.read()
+        if response.status != 200:
+            raise RuntimeError(f"{base_url}/ answered HTTP {response.status}")
+        return referenced_paths(body.decode("utf-8", "replace"))
+    finally:
+        connection.close()
+
+
+@contextlib.contextmanager
+def serve_stdlib(root: Path = DIST_DIR) -> Iterator[str]:
+    """``python -m http.server`` in-process: the same server class and handler."""
+    handler = functools.partial(QuietHTTPRequestHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, args=(POLL_INTERVAL,), daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+SERVERS = {"stdlib": serve_stdlib, "tuned": serve_dist}
+
+
+def print_results(summaries: list[dict], stream=sys.stderr):
+    stream.write(
+        f"{'target':<28}{'pages/s':>10}{'req/s':>10}{'MB/s':>8}{'errors':>8}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}\n"
+    )
+    for summary in summaries:
+        page = summary["page"] or {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        stream.write(
+            f"{summary['target']:<28}{summary['pages_per_s']:>10.1f}{summary['requests_per_s']:>10.1f}"
+            f"{summary['mb_per_s']:>8.2f}{summary['errors']:>8}"
+            f"{page['p50']:>10.2f}{page['p95']:>10.2f}{page['p99']:>10.2f}{page['max']:>10.2f}\n"
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="load an already running server")
+    target.add_argument("--server", action="append", choices=sorted(SERVERS), help="start this server in-process")
+    parser.add_argument("--concurrency", type=int, default=8, help="parallel clients (connections)")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per target")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unmeasured seconds before measuring")
+    parser.add_argument("--rate", type=float, help="page loads per second to start; unlimited by default")
+    parser.add_argument("--output", type=Path, help="write the summaries as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    summaries = []
+    if args.url:
+        targets = [(args.url, contextlib.nullcontext(args.url.rstrip("/")))]
+    else:
+        targets = [(name, SERVERS[name]()) for name in args.server or sorted(SERVERS)]
+    for name, server in targets:
+        with server as base_url:
+            result = run_load(base_url, args.concurrency, args.duration, args.rate, args.warmup)
+        result.target = name
+        summaries.append(result.summary())
+    print_results(summaries)
+    if args.output:
+        args.output.write_text(json.dumps(summaries, indent=2), encoding="utf-8")
+    return 1 if any(summary["errors"] for summary in summaries) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""Executable model of the transfer rules and a bulk checker against the page.
+
+The rules come from the test-case catalogs:
+
+* the commission is 10 % of the amount rounded down (TC-004, TC-012);
+* balance minus reserved must cover amount plus commission (TC-011);
+* the card number must have exactly 16 digits (TC-005);
+* the amount must be positive.
+
+``generate_cases`` produces reproducible random cases. ``check_cases``
+drives a single loaded page through a whole batch of them inside one
+async script - only the account, card and amount inputs change between
+cases - and returns a snapshot per case for ``compare`` to judge.
+"""
+import math
+import random
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.inputs import FILL_JS
+from support.pages import LOCATORS
+from support.snapshot import ACCOUNTS, COLLECT_JS, PageSnapshot, parse_snapshot
+
+
+COMMISSION_RATE = 0.1
+CARD_LENGTH = 16
+
+# Only the ruble account takes its numbers from the URL; the others are fixed in the app.
+FIXED_ACCOUNTS = {"usd": (100, 0), "euro": (300, 26)}
+
+
+@dataclass(frozen=True)
+class Case:
+    balance: int
+    reserved: int
+    account: str
+    card: str
+    amount: str
+
+
+@dataclass(frozen=True)
+class Expectation:
+    card_accepted: bool
+    commission: int | None
+    allowed: bool
+
+
+def commission(amount: int) -> int:
+    return math.floor(amount * COMMISSION_RATE)
+
+
+def available(case: Case) -> int:
+    balance, reserved = FIXED_ACCOUNTS.get(case.account, (case.balance, case.reserved))
+    return balance - reserved
+
+
+def expect(case: Case) -> Expectation:
+    card_accepted = len(case.card) == CARD_LENGTH and case.card.isdigit()
+    amount = int(case.amount)
+    fee = commission(amount) if amount > 0 else None
+    allowed = card_accepted and amount > 0 and amount + fee <= available(case)
+    return Expectation(card_accepted=card_accepted, commission=fee, allowed=allowed)
+
+
+def compare(case: Case, snapshot: PageSnapshot) -> list[str]:
+    """Describe every way ``snapshot`` disagrees with the oracle for ``case``."""
+    expected = expect(case)
+    mismatches = []
+    if snapshot.send_button != expected.allowed:
+        verb = "shown" if snapshot.send_button else "hidden"
+        mismatches.append(f"send button {verb}, expected allowed={expected.allowed}")
+    if expected.card_accepted:
+        if expected.commission is not None and snapshot.commission != str(expected.commission):
+            mismatches.append(f"commission {snapshot.commission!r}, expected {expected.commission}")
+        if (snapshot.error is not None) == expected.allowed:
+            mismatches.append(f"error {snapshot.error!r}, expected allowed={expected.allowed}")
+    return [f"{case}: {mismatch}" for mismatch in mismatches]
+
+
+def generate_cases(count: int, seed: int = 0, preconditions: int = 4) -> list[Case]:
+    """Build ``count`` reproducible cases over a few (balance, reserved) pairs.
+
+    Few distinct pairs keep the number of page loads small; amounts are
+    biased towards the boundaries of what the account can cover.
+    """
+    rng = random.Random(seed)
+    pairs = [(1100, 0)]
+    while len(pairs) < preconditions:
+        balance = rng.randint(0, 100_000)
+        pairs.append((balance, rng.randint(0, balance)))
+
+    cases = []
+    for _ in range(count):
+        balance, reserved = rng.choice(pairs)
+        account = rng.choice(ACCOUNTS)
+        limit = available(Case(balance, reserved, account, "", "0"))
+        amount = rng.choice([
+            rng.randint(-1000, 0),
+            rng.randint(1, 1000),
+            rng.randint(1, max(limit, 1) * 2),
+            limit * 10 // 11 + rng.randint(-2, 2),
+        ])
+        card_length = rng.choice([CARD_LENGTH] * 6 + [12, 15, 17, 18])
+        card = "".join(rng.choice("0123456789") for _ in range(card_length))
+        cases.append(Case(balance, reserved, account, card, str(amount)))
+    return cases
+
+
+def group_by_preconditions(cases: Iterable[Case]) -> dict[tuple[int, int], list[Case]]:
+    groups = defaultdict(list)
+    for case in cases:
+        groups[case.balance, case.reserved].append(case)
+    return dict(groups)
+
+
+def chunks(cases: list[Case], size: int) -> Iterator[list[Case]]:
+    for start in range(0, len(cases), size):
+        yield cases[start:start + size]
+
+
+CHECK_SCRIPT = COLLECT_JS + FILL_JS + """
+const [cases, accounts, cardSelector, amountSelector, done] = arguments;
+// React flushes updates from dispatched events asynchronously, so yield after every step.
+const tick = () => new Promise((resolve) => setTimeout(resolve, 0));
+const fill = async (field, text) => {
+    fillInput(field, text, false);
+    await tick();
+};
+
+(async () => {
+    const results = [];
+    for (const item of cases) {
+        document.getElementById(item.account + "-sum").click();
+        await tick();
+        await fill(document.querySelector(cardSelector), item.card);
+        const amountField = document.querySelector(amountSelector);
+        if (amountField) {
+            await fill(amountField, item.amount);
+        }
+        results.push(collectSnapshot(accounts));
+    }
+    done(results);
+})().catch((error) => done({error: String(error)}));
+"""
+
+
+def check_cases(driver: WebDriver, cases: list[Case]) -> list[PageSnapshot]:
+    """Run ``cases`` on the currently loaded page and snapshot the screen after each."""
+    payload = [{"account": case.account, "card": case.card, "amount": case.amount} for case in cases]
+    raw = driver.execute_async_script(
+        CHECK_SCRIPT, payload, list(ACCOUNTS), LOCATORS["card_input"][1], LOCATORS["amount_input"][1]
+    )
+    if isinstance(raw, dict):
+        raise RuntimeError(f"oracle batch failed in the page: {raw['error']}")
+    return [parse_snapshot(item) for item in raw]
@@ -0,0 +1,163 @@
+"""Page object for the F-Bank transfer screen.
+
+Locators prefer ids and short CSS selectors over the absolute XPaths the
+test classes used to copy around. Found elements are cached and reused
+until the DOM they belong to is replaced: a stale reference (new page
+load or a React re-mount) drops the cache entry and the element is looked
+up again once.
+"""
+from collections.abc import Callable
+from typing import TypeVar
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from support.alerts import drain_alerts, wait_for_alerts
+from support.config import ALERT_MODE, BASE_URL, INPUT_MODE
+from support.inputs import fill_fast
+from support.snapshot import PageSnapshot, take_snapshot
+from support.tracing import traced
+from support.waits import expect_present
+
+
+FIND_TIMEOUT = 60
+
+TRANSFER_PANEL = "#root > div > div > div:nth-child(2)"
+
+LOCATORS = {
+    "rub_sum": (By.ID, "rub-sum"),
+    "rub_reserved": (By.ID, "rub-reserved"),
+    "usd_sum": (By.ID, "usd-sum"),
+    "usd_reserved": (By.ID, "usd-reserved"),
+    "euro_sum": (By.ID, "euro-sum"),
+    "euro_reserved": (By.ID, "euro-reserved"),
+    "commission": (By.ID, "comission"),
+    "card_input": (By.CSS_SELECTOR, 'input[placeholder="0000 0000 0000 0000"]'),
+    "amount_input": (By.CSS_SELECTOR, 'input[placeholder="1000"]'),
+    "send_button": (By.CSS_SELECTOR, f"{TRANSFER_PANEL} button"),
+    "error_message": (By.CSS_SELECTOR, f'{TRANSFER_PANEL} span[style*="color: red"]'),
+}
+
+T = TypeVar("T")
+
+
+class TransferPage:
+    def __init__(self, driver: WebDriver, input_mode: str = INPUT_MODE):
+        self.driver = driver
+        self.input_mode = input_mode
+        self._elements: dict[str, WebElement] = {}
+        self._alerts: list[str] = []
+
+    @traced("load")
+    def open(self, balance: int | float | str, reserved: int | float | str):
+        self.driver.get(f"{BASE_URL}/?balance={balance}&reserved={reserved}")
+        self.forget()
+
+    def forget(self):
+        """Drop every cached element, e.g. after navigating."""
+        self._elements.clear()
+
+    def element(self, name: str) -> WebElement:
+        """Return the clickable element ``name``, cached until it goes stale."""
+        cached = self._elements.get(name)
+        if cached is not None:
+            return cached
+        element = WebDriverWait(self.driver, FIND_TIMEOUT).until(EC.element_to_be_clickable(LOCATORS[name]))
+        self._elements[name] = element
+        return element
+
+    def optional_element(self, name: str) -> WebElement | None:
+        """Return ``name`` once the render settles, or None if it is not shown."""
+        element = expect_present(self.driver, LOCATORS[name])
+        if element is None:
+            self._elements.pop(name, None)
+        else:
+            self._elements[name] = element
+        return element
+
+    def _with(self, name: str, action: Callable[[WebElement], T]) -> T:
+        try:
+            return action(self.element(name))
+        except StaleElementReferenceException:
+            self._elements.pop(name, None)
+            return action(self.element(name))
+
+    @traced("act")
+    def select_account(self, label: str):
+        # A click on the balance bubbles up to the card's onClick handler.
+        self._with(f"{label}_sum", lambda element: element.click())
+
+    def enable_rubles(self):
+        self.select_account("rub")
+
+    def enable_dollars(self):
+        self.select_account("usd")
+
+    def enable_evro(self):
+        self.select_account("euro")
+
+    def _type(self, name: str, text: str, clear: bool) -> str:
+        def type_into(field: WebElement) -> str:
+            if self.input_mode == "fast":
+                return fill_fast(field, text, append=not clear).replace(" ", "")
+            if clear:
+                field.clear()
+            field.send_keys(text)
+            return field.get_attribute("value").replace(" ", "")
+
+        return self._with(name, type_into)
+
+    @traced("act")
+    def card_input(self, card_number: str, clear: bool = False) -> str:
+        return self._type("card_input", card_number, clear)
+
+    @traced("act")
+    def amount_input(self, amount: str, clear: bool = True) -> str:
+        return self._type("amount_input", amount, clear)
+
+    @traced("act")
+    def commission(self) -> str:
+        return self._with("commission", lambda element: element.text.replace(" ", ""))
+
+    @traced("act")
+    def balance(self, label: str = "rub") -> str:
+        return self._with(f"{label}_sum", lambda element: element.text.replace("'", ""))
+
+    @traced("act")
+    def reserved(self, label: str = "rub") -> str:
+        return self._with(f"{label}_reserved", lambda element: element.text.replace("'", ""))
+
+    @traced("wait")
+    def send_button(self) -> WebElement | None:
+        return self.optional_element("send_button")
+
+    @traced("wait")
+    def error_message(self) -> WebElement | None:
+        return self.optional_element("error_message")
+
+    @traced("wait")
+    def accept_alert(self) -> str:
+        """Return the next alert message, accepting the dialog in ``dialog`` mode."""
+        if ALERT_MODE == "capture":
+            if not self._alerts:
+                self._alerts.extend(wait_for_alerts(self.driver))
+            return self._alerts.pop(0)
+        alert = self.driver.switch_to.alert
+        alert_text = alert.text
+        alert.accept()
+        return alert_text
+
+    @traced("act")
+    def captured_alerts(self) -> list[str]:
+        """Every alert captured since the last read (``capture`` mode only)."""
+        messages = self._alerts + drain_alerts(self.driver)
+        self._alerts.clear()
+        return messages
+
+    @traced("wait")
+    def snapshot(self, settle: bool = True) -> PageSnapshot:
+        return take_snapshot(self.driver, settle)
@@ -0,0 +1,138 @@
+"""In-browser responsiveness measurements of the ``dist/`` bundle.
+
+A probe installed before any page script records long tasks and the
+moment the balance cards first render. Input latency is timed inside the
+page, from the ``input`` event on the amount field to the DOM commit of
+the new commission/error state and to the following animation frame.
+DevTools ``Performance.getMetrics`` supplies script duration, layout
+count and JS heap size. ``CPU_THROTTLE`` slows the CPU down the way
+DevTools does, to imitate weak devices.
+"""
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from support.devtools import add_document_script
+from support.inputs import FILL_JS
+from support.snapshot import ERROR_JS
+
+
+MEASURE_TIMEOUT_MS = 5000
+
+PROBE_SCRIPT = """
+(() => {
+    const perf = {longTasks: [], firstCards: null};
+    Object.defineProperty(window, "__perf", {value: perf});
+    try {
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) {
+                perf.longTasks.push(entry.duration);
+            }
+        }).observe({type: "longtask", buffered: true});
+    } catch (error) {}
+    const observer = new MutationObserver(() => {
+        if (document.getElementById("rub-sum")) {
+            perf.firstCards = performance.now();
+            observer.disconnect();
+        }
+    });
+    observer.observe(document, {childList: true, subtree: true});
+})();
+"""
+
+FIRST_RENDER_SCRIPT = """
+const [timeoutMs, done] = arguments;
+const started = performance.now();
+const poll = () => {
+    const perf = window.__perf;
+    if (perf && perf.firstCards !== null) {
+        done({first_cards_ms: perf.firstCards, long_tasks: perf.longTasks.slice()});
+    } else if (performance.now() - started > timeoutMs) {
+        done({first_cards_ms: null, long_tasks: perf ? perf.longTasks.slice() : []});
+    } else {
+        requestAnimationFrame(poll);
+    }
+};
+poll();
+"""
+
+INPUT_LATENCY_SCRIPT = FILL_JS + ERROR_JS + """
+const [field, text, expectError, timeoutMs, done] = arguments;
+const root = document.getElementById("root");
+const commissionText = () => {
+    const element = document.getElementById("comission");
+    return element ? element.textContent : null;
+};
+const errorShown = () => findError(root) !== null;
+const before = commissionText();
+const longTasksBefore = window.__perf ? window.__perf.longTasks.length : 0;
+let finished = false;
+
+const finish = (commitMs) => {
+    finished = true;
+    observer.disconnect();
+    clearTimeout(deadline);
+    requestAnimationFrame(() => done({
+        commit_ms: commitMs,
+        frame_ms: commitMs === null ? null : performance.now() - started,
+        commission: commissionText(),
+        error: errorShown(),
+        long_tasks: window.__perf ? window.__perf.longTasks.slice(longTasksBefore) : [],
+    }));
+};
+const check = () => {
+    if (!finished && commissionText() !== before && (expectError === null || errorShown() === expectError)) {
+        finish(performance.now() - started);
+    }
+};
+const observer = new MutationObserver(check);
+observer.observe(root, {subtree: true, childList: true, characterData: true, attributes: true});
+const deadline = setTimeout(() => finish(null), timeoutMs);
+
+const started = performance.now();
+fillInput(field, text, false);
+"""
+
+
+def install_probe(driver: WebDriver) -> str:
+    """Install the probe for documents loaded from now on; returns its identifier."""
+    return add_document_script(driver, PROBE_SCRIPT)
+
+
+def set_cpu_throttling(driver: WebDriver, rate: float):
+    """Slow the CPU down ``rate`` times (1 switches throttling off)."""
+    driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": rate})
+
+
+def browser_metrics(driver: WebDriver) -> dict[str, float]:
+    driver.execute_cdp_cmd("Performance.enable", {})
+    metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    return {metric["name"]: metric["value"] for metric in metrics}
+
+
+def disable_metrics(driver: WebDriver):
+    """Switch off the ``Performance`` domain ``browser_metrics`` enabled."""
+    driver.execute_cdp_cmd("Performance.disable", {})
+
+
+def metrics_delta(before: dict[str, float], after: dict[str, float]) -> dict[str, float]:
+    return {name: after[name] - before.get(name, 0) for name in after}
+
+
+def first_render(driver: WebDriver, url: str, timeout_ms: int = MEASURE_TIMEOUT_MS) -> dict:
+    """Load ``url`` and report when the balance cards first rendered, relative to navigation start."""
+    driver.get(url)
+    return driver.execute_async_script(FIRST_RENDER_SCRIPT, timeout_ms)
+
+
+def input_latency(
+    driver: WebDriver,
+    field: WebElement,
+    text: str,
+    expect_error: bool | None = None,
+    timeout_ms: int = MEASURE_TIMEOUT_MS,
+) -> dict:
+    """Type ``text`` into ``field`` and time the commission (and error) update.
+
+    ``commit_ms`` is None if the commission did not change within the timeout.
+    """
+    return driver.execute_async_script(INPUT_LATENCY_SCRIPT, field, text, expect_error, timeout_ms)
@@ -0,0 +1,146 @@
+"""Flight recorder: what led up to a failed UI test, written only on failure.
+
+While a test runs, two ring buffers fill up at next to no cost:
+
+* in Python, every page-object helper call (see ``support.tracing.traced``)
+  is appended to a bounded deque - no formatting, no I/O;
+* in the page, a stub installed before any page script keeps the latest
+  console messages, uncaught JS errors and every change of the
+  ``#rub-sum`` / ``#comission`` / error span texts - no WebDriver round
+  trips.
+
+When a test fails, both buffers are merged by time and written to
+``FLIGHT_DIR/<test id>/`` together with one screenshot and the DOM.
+Passing tests never read the page buffer and never touch the disk.
+An empty ``FLIGHT_DIR`` switches the dumps off.
+"""
+import json
+import re
+import time
+from collections import deque
+from pathlib import Path
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.config import FLIGHT_DIR, FLIGHT_EVENTS
+from support.devtools import add_document_script
+from support.snapshot import ERROR_JS
+
+
+PAGE_RECORDER = """
+(() => {
+    if (window.__flight) {
+        return;
+    }
+""" + ERROR_JS + """
+    const limit = %d;
+    const events = [];
+    Object.defineProperty(window, "__flight", {value: events});
+    const push = (kind, data) => {
+        events.push({time: performance.timeOrigin + performance.now(), kind, ...data});
+        if (events.length > limit) {
+            events.shift();
+        }
+    };
+    for (const level of ["error", "warn", "info", "log"]) {
+        const original = console[level];
+        console[level] = (...args) => {
+            push("console", {level, text: args.map(String).join(" ")});
+            return original.apply(console, args);
+        };
+    }
+    window.addEventListener("error", (event) => {
+        push("js-error", {text: event.message, source: `${event.filename}:${event.lineno}:${event.colno}`});
+    });
+    window.addEventListener("unhandledrejection", (event) => {
+        push("js-error", {text: String(event.reason)});
+    });
+    const text = (id) => {
+        const element = document.getElementById(id);
+        return element ? element.textContent : null;
+    };
+    let last = null;
+    new MutationObserver(() => {
+        const error = findError(document);
+        const state = {rub_sum: text("rub-sum"), commission: text("comission"), error: error ? error.textContent : null};
+        const key = JSON.stringify(state);
+        if (key !== last) {
+            last = key;
+            push("state", state);
+        }
+    }).observe(document, {subtree: true, childList: true, characterData: true});
+})();
+"""
+
+READ_SCRIPT = "return window.__flight ? window.__flight.slice() : [];"
+
+
+def install_page_recorder(driver: WebDriver) -> str:
+    """Install the page buffer for documents loaded from now on; returns its identifier."""
+    return add_document_script(driver, PAGE_RECORDER % FLIGHT_EVENTS)
+
+
+def safe_name(test_id: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", test_id)
+
+
+class FlightRecorder:
+    def __init__(self, directory: str = FLIGHT_DIR, capacity: int = FLIGHT_EVENTS):
+        self.directory = Path(directory) if directory else None
+        self.events: deque[tuple] = deque(maxlen=capacity)
+
+    def start(self, test_id: str):
+        self.events.clear()
+        self.record("test", test_id)
+
+    def record(self, kind: str, name: str, args: tuple = ()):
+        """Remember one step; the arguments are only formatted if the test fails."""
+        self.events.append((time.time() * 1000, kind, name, args))
+
+    def timeline(self, page_events: list[dict]) -> list[dict]:
+        steps = [
+            {"time": stamp, "kind": kind, "name": name, "args": [repr(arg) for arg in args]}
+            for stamp, kind, name, args in self.events
+        ]
+        return sorted(steps + page_events, key=lambda event: event["time"])
+
+    def dump(self, driver: WebDriver | None, test_id: str) -> Path | None:
+        """Write the buffers, a screenshot and the DOM of ``driver`` for the failed ``test_id``."""
+        if self.directory is None:
+            return None
+        target = self.directory / f"{safe_name(test_id)}-{time.strftime('%Y%m%d-%H%M%S')}"
+        target.mkdir(parents=True, exist_ok=True)
+        page_events = []
+        if driver is not None:
+            page_events = self._collect(driver, target)
+        (target / "flight.json").write_text(
+            json.dumps(self.timeline(page_events), indent=1, ensure_ascii=False), encoding="utf-8"
+        )
+        return target
+
+    def _collect(self, driver: WebDriver, target: Path) -> list[dict]:
+        """Page buffer, screenshot and DOM, as far as the browser still answers."""
+        events = []
+        try:
+            # An open alert blocks every other command; keep its text and get it out of the way.
+            alert = driver.switch_to.alert
+            events.append({"time": time.time() * 1000, "kind": "open-alert", "text": alert.text})
+            alert.dismiss()
+        except NoAlertPresentException:
+            pass
+        except WebDriverException as error:
+            return [{"time": time.time() * 1000, "kind": "recorder-error", "text": str(error)}]
+        for name, collect in (
+            ("page buffer", lambda: events.extend(driver.execute_script(READ_SCRIPT))),
+            ("screenshot", lambda: driver.save_screenshot(str(target / "screenshot.png"))),
+            ("DOM", lambda: (target / "dom.html").write_text(driver.page_source, encoding="utf-8")),
+        ):
+            try:
+                collect()
+            except WebDriverException as error:
+                events.append({"time": time.time() * 1000, "kind": "recorder-error", "text": f"{name}: {error}"})
+        return events
+
+
+recorder = FlightRecorder()
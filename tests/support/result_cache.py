@@ -0,0 +1,94 @@
+"""Cache of passing results, keyed by everything a UI test depends on.
+
+The app under test is the prebuilt, content-hashed ``dist/`` bundle, so a
+test whose inputs have not changed gives the same answer on the next run.
+A test's key combines the hashes of ``dist/``, the ``support`` package,
+the markdown test-case catalogs and the test's own module with the Chrome version, the browser options of
+the selected profile and the environment switches that change behaviour.
+Only passes are cached; failures always run again.
+"""
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+CACHE_FILE = TESTS_DIR / ".test-cache.json"
+DIST_DIR = TESTS_DIR.parent / "dist"
+SUPPORT_DIR = TESTS_DIR / "support"
+
+CACHEABLE_STATUSES = ("ok", "skipped", "expected failure")
+KEY_ENVIRONMENT = (
+    "BROWSER_PROFILE", "ALERT_MODE", "INPUT_MODE", "SERVE_MODE", "CPU_THROTTLE", "ORACLE_CASES", "ORACLE_SEED",
+)
+
+
+def files_digest(paths: Iterable[Path], root: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def environment_digest() -> str:
+    """Digest of the inputs shared by every test in this run."""
+    from support.catalog import CATALOG_FILES, REPOSITORY_DIR
+    from support.config import BROWSER_PROFILE
+    from support.drivers import PROFILES, chrome_options, installed_chrome_version
+
+    parts = {
+        "dist": files_digest((path for path in DIST_DIR.rglob("*") if path.is_file()), DIST_DIR),
+        "support": files_digest(SUPPORT_DIR.glob("*.py"), SUPPORT_DIR),
+        "catalogs": files_digest(CATALOG_FILES, REPOSITORY_DIR),
+        "chrome": installed_chrome_version(),
+        "options": chrome_options(PROFILES[BROWSER_PROFILE]).to_capabilities() if BROWSER_PROFILE in PROFILES else None,
+        "environment": {name: os.environ.get(name) for name in KEY_ENVIRONMENT},
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def test_keys(test_ids: list[str]) -> dict[str, str]:
+    """Cache key of every test; the test modules must already be imported."""
+    shared = environment_digest()
+    module_digests = {}
+    keys = {}
+    for test_id in test_ids:
+        module_name = test_id.split(".", 1)[0]
+        if module_name not in module_digests:
+            module_file = getattr(sys.modules.get(module_name), "__file__", None)
+            source = Path(module_file).read_bytes() if module_file else test_id.encode()
+            module_digests[module_name] = hashlib.sha256(source).hexdigest()
+        keys[test_id] = hashlib.sha256(f"{shared}:{module_digests[module_name]}:{test_id}".encode()).hexdigest()
+    return keys
+
+
+class ResultCache:
+    def __init__(self, path: Path = CACHE_FILE):
+        self.path = path
+        try:
+            self.entries: dict[str, dict] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def lookup(self, test_id: str, key: str) -> dict | None:
+        """Return the cached record of ``test_id`` if it was produced with ``key``."""
+        entry = self.entries.get(test_id)
+        if entry is None or entry["key"] != key:
+            return None
+        return dict(entry["record"], cached=True)
+
+    def store(self, records: list[dict], keys: dict[str, str]):
+        for record in records:
+            if record.get("cached") or record["id"] not in keys:
+                continue
+            if record["status"] in CACHEABLE_STATUSES:
+                self.entries[record["id"]] = {"key": keys[record["id"]], "record": record}
+            else:
+                self.entries.pop(record["id"], None)
+
+    def save(self):
+        self.path.write_text(json.dumps(self.entries, indent=1, sort_keys=True), encoding="utf-8")
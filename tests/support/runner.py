@@ -0,0 +1,323 @@
+"""Parallel runner for the UI suite.
+
+Tests are sharded across worker processes. Every worker serves ``dist/``
+on its own port - or, with ``SERVE_MODE=memory``, from its browser's
+DevTools hooks (see ``support.interception``) - points ``APP_BASE_URL``
+at it and runs its shard on one warm browser; the parent merges the
+results into a single report.
+
+Passing results are cached by the hash of everything a test depends on
+(see ``support.result_cache``) and replayed while those inputs are
+unchanged; ``--force`` runs every test regardless.
+
+Before any browser starts, the served app is smoke-checked over plain
+HTTP (see ``support.smoke``); a broken build fails the run in
+milliseconds. ``--skip-smoke`` goes straight to the browser tests.
+
+Every record carries the browser's memory after the test (see
+``support.watchdog``); the report lists the tests that grew it most.
+
+Durations and outcomes are kept in a history file between runs. Tests
+that failed last time are scheduled first for quick feedback; the rest
+are packed longest-first onto the least loaded worker.
+
+Usage (from the ``tests`` directory)::
+
+    python -m support.runner --workers 4 --report report.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+
+TESTS_DIR = Path(__file__).resolve().parents[1]
+HISTORY_FILE = TESTS_DIR / ".test-history.json"
+
+# Weight of the newest run in a test's remembered duration.
+DURATION_SMOOTHING = 0.5
+
+FAILING_STATUSES = ("fail", "error", "unexpected success")
+MEMORY_REPORT_ROWS = 10
+
+
+class RecordingResult(unittest.TestResult):
+    """Collects one picklable record per test instead of printing."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: list[dict] = []
+        self._current: dict | None = None
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._current = {"id": test.id(), "status": "ok", "details": "", "started": time.perf_counter()}
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        record = self._current
+        record["duration"] = time.perf_counter() - record.pop("started")
+        self.records.append(record)
+        self._current = None
+
+    def _set_status(self, test, status: str, details: str = ""):
+        if self._current is None:
+            # setUpClass / setUpModule errors are reported outside startTest
+            self.records.append({"id": test.id(), "status": status, "details": details, "duration": 0.0})
+            return
+        if self._current["status"] in FAILING_STATUSES:
+            return
+        self._current["status"] = status
+        self._current["details"] = details
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._set_status(test, "error", "".join(traceback.format_exception(*err)))
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._set_status(test, "fail", "".join(traceback.format_exception(*err)))
+
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            status = "fail" if issubclass(err[0], test.failureException) else "error"
+            self._set_status(subtest, status, "".join(traceback.format_exception(*err)))
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        if getattr(test, "test_case", None) is not None and self._current is not None:
+            # A skipped subtest; the test itself still ran.
+            self._current["skipped_subtests"] = self._current.get("skipped_subtests", 0) + 1
+            return
+        self._set_status(test, "skipped", reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._set_status(test, "expected failure")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._set_status(test, "unexpected success")
+
+
+def iter_tests(suite: unittest.TestSuite):
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from iter_tests(item)
+        else:
+            yield item
+
+
+def discover_ids(pattern: str = "test*.py") -> list[str]:
+    suite = unittest.defaultTestLoader.discover(str(TESTS_DIR), pattern=pattern)
+    return [test.id() for test in iter_tests(suite)]
+
+
+def load_history(path: Path) -> dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def update_history(history: dict[str, dict], records: list[dict]) -> dict[str, dict]:
+    updated = dict(history)
+    for record in records:
+        previous = history.get(record["id"])
+        duration = record["duration"]
+        if previous is not None:
+            duration = DURATION_SMOOTHING * duration + (1 - DURATION_SMOOTHING) * previous["duration"]
+        updated[record["id"]] = {"duration": duration, "status": record["status"]}
+    return updated
+
+
+def save_history(path: Path, history: dict[str, dict]):
+    path.write_text(json.dumps(history, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def schedule(test_ids: list[str], workers: int, history: dict[str, dict] | None = None) -> list[list[str]]:
+    """Split tests into per-worker shards, known failures first, then longest first.
+
+    Each test goes to the worker with the least expected work so far
+    (longest-processing-time-first), which keeps the slowest worker - and
+    so the whole run - as short as possible. Tests without history are
+    assumed to take the average known duration.
+    """
+    history = history or {}
+    known = [history[test_id]["duration"] for test_id in test_ids if test_id in history]
+    default_duration = sum(known) / len(known) if known else 1.0
+
+    def duration(test_id: str) -> float:
+        return history.get(test_id, {}).get("duration", default_duration)
+
+    def failed(test_id: str) -> bool:
+        return history.get(test_id, {}).get("status") in FAILING_STATUSES
+
+    ordered = sorted(test_ids, key=lambda test_id: (not failed(test_id), -duration(test_id), test_id))
+    shards = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for test_id in ordered:
+        index = loads.index(min(loads))
+        shards[index].append(test_id)
+        loads[index] += duration(test_id)
+    return [ids for ids in shards if ids]
+
+
+def run_shard(test_ids: list[str]) -> dict:
+    """Worker entry point: serve ``dist/`` on a free port and run ``test_ids``.
+
+    Returns the test records and the path of the worker's trace, if any.
+    """
+    from support.interception import serve_app
+
+    with serve_app() as base_url:
+        # Must be set before the test modules (and support.config) are imported.
+        os.environ["APP_BASE_URL"] = base_url
+        if str(TESTS_DIR) not in sys.path:
+            sys.path.insert(0, str(TESTS_DIR))
+
+        suite = unittest.defaultTestLoader.loadTestsFromNames(test_ids)
+        result = RecordingResult()
+        try:
+            suite.run(result)
+        finally:
+            from support.session import close_all_pools
+            from support.tracing import tracer
+            from support.watchdog import watchdog
+            # Worker processes exit without running atexit handlers.
+            close_all_pools()
+            trace = tracer.flush(summary=False)
+    memory = {sample.test: sample.to_record() for sample in watchdog.samples}
+    for record in result.records:
+        if record["id"] in memory:
+            record["memory"] = memory[record["id"]]
+    return {"records": result.records, "trace": str(trace) if trace else None}
+
+
+def smoke_check() -> list[str]:
+    from support.server import DIST_DIR, serve_dist
+    from support.smoke import check_app
+
+    with serve_dist() as base_url:
+        return check_app(base_url, DIST_DIR)
+
+
+def run_parallel(
+    test_ids: list[str], workers: int, history: dict[str, dict] | None = None
+) -> tuple[list[dict], list[Path]]:
+    shards = schedule(test_ids, workers, history)
+    if not shards:
+        return [], []
+    # One process per shard, so that each worker imports the tests with its own APP_BASE_URL.
+    with ProcessPoolExecutor(
+        max_workers=len(shards), mp_context=get_context("spawn"), max_tasks_per_child=1
+    ) as executor:
+        outcomes = list(executor.map(run_shard, shards))
+    records = [record for outcome in outcomes for record in outcome["records"]]
+    traces = [Path(outcome["trace"]) for outcome in outcomes if outcome["trace"]]
+    return records, traces
+
+
+def print_report(records: list[dict], elapsed: float, verbose: bool, stream=sys.stderr):
+    records = sorted(records, key=lambda record: record["id"])
+    if verbose:
+        for record in records:
+            cached = ", cached" if record.get("cached") else ""
+            stream.write(f"{record['id']} ... {record['status']} ({record['duration']:.2f}s{cached})\n")
+
+    for record in records:
+        if record["status"] in ("fail", "error"):
+            stream.write("=" * 70 + "\n")
+            stream.write(f"{record['status'].upper()}: {record['id']}\n")
+            stream.write("-" * 70 + "\n")
+            stream.write(record["details"] + "\n")
+
+    stream.write("-" * 70 + "\n")
+    cached = sum(1 for record in records if record.get("cached"))
+    stream.write(f"Ran {len(records) - cached} tests in {elapsed:.3f}s, replayed {cached} cached passes\n\n")
+
+    counts = {}
+    for record in records:
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+    failed = sum(counts.get(status, 0) for status in FAILING_STATUSES)
+    details = ", ".join(f"{status}={count}" for status, count in sorted(counts.items()) if status != "ok")
+    summary = "FAILED" if failed else "OK"
+    stream.write(f"{summary} ({details})\n" if details else f"{summary}\n")
+
+
+def print_memory_report(records: list[dict], stream=sys.stderr):
+    """The tests that grew the browser most, and the sessions the watchdog recycled."""
+    sampled = [record for record in records if record.get("memory") and not record.get("cached")]
+    if not sampled:
+        return
+    growing = [record for record in sampled if record["memory"]["rss_delta_mb"] is not None]
+    growing.sort(key=lambda record: record["memory"]["rss_delta_mb"], reverse=True)
+    stream.write(f"\n{'Browser memory after test':<80}{'RSS MB':>10}{'delta MB':>10}{'JS heap MB':>12}\n")
+    for record in growing[:MEMORY_REPORT_ROWS]:
+        memory = record["memory"]
+        heap = f"{memory['js_heap_mb']:.1f}" if memory["js_heap_mb"] is not None else "-"
+        stream.write(f"{record['id'][:79]:<80}{memory['rss_mb']:>10.1f}{memory['rss_delta_mb']:>+10.1f}{heap:>12}\n")
+    recycled = [record["id"] for record in sampled if record["memory"]["recycled"]]
+    if recycled:
+        stream.write(f"Sessions recycled over the memory limits after {len(recycled)} tests: {', '.join(recycled)}\n")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-p", "--pattern", default="test*.py")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    parser.add_argument("--report", type=Path, help="write the merged results as JSON")
+    parser.add_argument("--force", action="store_true", help="run every test, ignoring cached passes")
+    parser.add_argument("--skip-smoke", action="store_true", help="do not check the served app before starting browsers")
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE, help="durations and outcomes of earlier runs")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    started = time.perf_counter()
+    from support.result_cache import ResultCache, test_keys
+
+    test_ids = discover_ids(args.pattern)
+    keys = test_keys(test_ids)
+    cache = ResultCache()
+    cached = [] if args.force else [
+        record for record in (cache.lookup(test_id, keys[test_id]) for test_id in test_ids) if record
+    ]
+    cached_ids = {record["id"] for record in cached}
+
+    history = load_history(args.history)
+    to_run = [test_id for test_id in test_ids if test_id not in cached_ids]
+    if to_run and not args.skip_smoke:
+        problems = smoke_check()
+        if problems:
+            sys.stderr.write("".join(f"SMOKE: {problem}\n" for problem in problems))
+            sys.stderr.write("Smoke check failed, browser tests were not started\n")
+            return 1
+    executed, traces = run_parallel(to_run, max(args.workers, 1), history)
+    elapsed = time.perf_counter() - started
+    save_history(args.history, update_history(history, executed))
+    cache.store(executed, keys)
+    cache.save()
+
+    records = cached + executed
+    print_report(records, elapsed, args.verbose)
+    print_memory_report(records)
+    if traces:
+        from support.tracing import load_events, print_summary
+        print_summary(load_events(traces))
+    if args.report:
+        args.report.write_text(json.dumps(records, indent=2, ensure_ascii=False), encoding="utf-8")
+    return 1 if any(record["status"] in FAILING_STATUSES for record in records) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""Static server for ``dist/`` owned by the test process.
+
+``python -m http.server`` rereads every file from disk, answers one
+request at a time and sends neither compression nor validators, so every
+page load downloads the whole bundle again. This server loads ``dist/``
+into memory once, precomputes gzip (and brotli, when the ``brotli``
+package is installed) variants, keeps connections alive and marks the
+content-hashed ``/assets/`` files as immutable so that a warm browser
+serves them from its cache.
+
+The listening socket is bound before ``serve_dist`` yields, so the base
+URL is usable immediately - there is nothing to poll.
+
+Standalone usage (replaces ``python -m http.server 8000`` in ``dist``)::
+
+    python -m support.server --port 8000
+"""
+import argparse
+import contextlib
+import gzip
+import hashlib
+import mimetypes
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+DIST_DIR = Path(__file__).resolve().parents[2] / "dist"
+
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+# Every encoded variant is a different representation and gets its own strong ETag.
+ETAG_SUFFIXES = {"gzip": "gz", "br": "br"}
+# serve_forever checks for shutdown this often; the default 0.5 s delays every exit.
+POLL_INTERVAL = 0.05
+
+
+@dataclass
+class Asset:
+    body: bytes
+    content_type: str
+    cache_control: str
+    etag: str = ""
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest()[:16] + '"'
+        if self.content_type.startswith(COMPRESSIBLE_TYPES):
+            self.encoded["gzip"] = gzip.compress(self.body, compresslevel=9, mtime=0)
+            if brotli is not None:
+                self.encoded["br"] = brotli.compress(self.body)
+
+    def etag_for(self, encoding: str | None) -> str:
+        if encoding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{ETAG_SUFFIXES[encoding]}"'
+
+
+def content_type(path: Path) -> str:
+    if path.suffix == ".js":
+        return "text/javascript; charset=utf-8"
+    guessed = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if guessed.startswith("text/"):
+        return f"{guessed}; charset=utf-8"
+    return guessed
+
+
+def load_assets(root: Path = DIST_DIR) -> dict[str, Asset]:
+    """Read every file under ``root`` into memory, keyed by its URL path."""
+    assets = {}
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+        url_path = "/" + path.relative_to(root).as_posix()
+        hashed = url_path.startswith("/assets/")
+        assets[url_path] = Asset(
+            body=path.read_bytes(),
+            content_type=content_type(path),
+            cache_control=IMMUTABLE_CACHE if hashed else REVALIDATE_CACHE,
+        )
+    assets["/"] = assets["/index.html"]
+    return assets
+
+
+def matches_etag(header: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header names ``etag``."""
+    if header is None:
+        return False
+    return any(tag.strip() in ("*", etag) for tag in header.split(","))
+
+
+def accepted_encodings(header: str) -> set[str]:
+    encodings = set()
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        quality = params.strip().removeprefix("q=") or "1"
+        try:
+            if float(quality) == 0:
+                continue
+        except ValueError:
+            pass
+        encodings.add(name.strip().lower())
+    return encodings
+
+
+class DistHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, the body of
+    # a keep-alive response waits for the client's delayed ACK (~40 ms).
+    disable_nagle_algorithm = True
+    assets: dict[str, Asset] = {}
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body: bool):
+        asset = self.assets.get(urlsplit(self.path).path)
+        if asset is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        body, encoding = asset.body, None
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding", ""))
+        for candidate in ("br", "gzip"):
+            if candidate in accepted and candidate in asset.encoded:
+                body, encoding = asset.encoded[candidate], candidate
+                break
+        etag = asset.etag_for(encoding)
+
+        if matches_etag(self.headers.get("If-None-Match"), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", asset.cache_control)
+            if asset.encoded:
+                self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", asset.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", asset.cache_control)
+        self.send_header("ETag", etag)
+        if asset.encoded:
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DistServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def make_server(port: int = 0, host: str = "127.0.0.1", root: Path = DIST_DIR) -> DistServer:
+    handler = type("BoundDistHandler", (DistHandler,), {"assets": load_assets(root)})
+    return DistServer((host, port), handler)
+
+
+@contextlib.contextmanager
+def serve_dist(port: int = 0, root: Path = DIST_DIR) -> Iterator[str]:
+    """Serve ``root`` on ``port`` (0 picks a free one) and yield its base URL."""
+    server = make_server(port, root=root)
+    thread = threading.Thread(target=server.serve_forever, args=(POLL_INTERVAL,), daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Serve dist/ from memory.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    server = make_server(args.port, args.host)
+    print(f"Serving dist/ on http://{args.host}:{server.server_port}", flush=True)
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Warm Chrome sessions shared by the test classes of one worker.
+
+Starting Chrome is most of a UI test's wall-clock time, so every worker
+process keeps one browser alive and hands it from test to test. Between
+tests the session is reset cheaply; a browser that crashed, stopped
+answering or grew past the watchdog's memory limits (see
+``support.watchdog``) is thrown away and started again.
+"""
+import atexit
+import sys
+import threading
+import unittest
+from typing import Callable
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.config import BASE_URL
+from support.drivers import create_driver
+from support.pages import TransferPage
+from support.recorder import recorder
+from support.snapshot import PageSnapshot
+from support.tracing import tracer
+from support.watchdog import kill_tree, watchdog
+
+
+HEALTH_CHECK_TIMEOUT = 5
+RESET_URL = f"{BASE_URL}/?balance=&reserved="
+
+_pools: list["SessionPool"] = []
+
+
+def is_responsive(driver: WebDriver, timeout: float = HEALTH_CHECK_TIMEOUT) -> bool:
+    """Return True if the browser answers a trivial command within ``timeout``.
+
+    The probe runs in a helper thread so that a hung browser cannot block
+    the caller for longer than the timeout.
+    """
+    answered = threading.Event()
+
+    def probe():
+        try:
+            driver.execute_script("return document.readyState")
+            answered.set()
+        except WebDriverException:
+            pass
+
+    thread = threading.Thread(target=probe, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return answered.is_set()
+
+
+def dismiss_alerts(driver: WebDriver):
+    while True:
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            return
+
+
+class SessionPool:
+    """Keeps one warm browser per worker process."""
+
+    def __init__(self, factory: Callable[[], WebDriver] = create_driver):
+        self._factory = factory
+        self._driver: WebDriver | None = None
+        _pools.append(self)
+
+    def acquire(self) -> WebDriver:
+        if self._driver is not None and not is_responsive(self._driver):
+            self.recycle()
+        if self._driver is None:
+            self._driver = self._factory()
+        return self._driver
+
+    def release(self, driver: WebDriver, test_id: str | None = None):
+        """Take ``driver`` back after ``test_id``, recycling it if it is broken or too big."""
+        if driver is not self._driver:
+            discard(driver)
+            return
+        # Sampled before the reset closes the test's tabs and navigates away.
+        over_budget = test_id is not None and watchdog.over_budget(driver, test_id)
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            self.recycle()
+            return
+        if over_budget:
+            self.recycle()
+
+    def reset(self, driver: WebDriver):
+        """Bring a used session back to the state of a freshly started one."""
+        dismiss_alerts(driver)
+        main_window, *extra_windows = driver.window_handles
+        for handle in extra_windows:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(main_window)
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        driver.delete_all_cookies()
+        driver.get(RESET_URL)
+        dismiss_alerts(driver)
+
+    def recycle(self):
+        if self._driver is not None:
+            watchdog.forget(self._driver)
+            discard(self._driver)
+            self._driver = None
+
+    def close(self):
+        self.recycle()
+
+
+def discard(driver: WebDriver):
+    """Quit a browser, killing chromedriver and Chrome if it does not answer."""
+    if is_responsive(driver):
+        try:
+            driver.quit()
+            return
+        except WebDriverException:
+            pass
+    process = getattr(driver.service, "process", None)
+    if process is not None:
+        kill_tree(process.pid)
+        # Still works where the process tree cannot be read.
+        try:
+            process.kill()
+        except OSError:
+            pass
+
+
+def close_all_pools():
+    """Close every pool, then kill what is left of any browser this process started."""
+    for pool in _pools:
+        pool.close()
+    watchdog.reap()
+
+
+session_pool = SessionPool()
+atexit.register(close_all_pools)
+
+
+class BrowserTestCase(unittest.TestCase):
+    """Base class for UI tests.
+
+    ``self.driver`` is the worker's shared browser, taken from ``pool``, and
+    ``self.page`` the transfer screen page object bound to it.
+    """
+
+    pool = session_pool
+
+    def setUp(self) -> None:
+        tracer.test_started(self.id())
+        recorder.start(self.id())
+        with tracer.step("SessionPool.acquire", "startup"):
+            self.driver = self.pool.acquire()
+        # A cleanup, unlike tearDown, also runs when the rest of setUp fails.
+        self.addCleanup(self._release)
+        self.page = TransferPage(self.driver)
+        if getattr(getattr(self, self._testMethodName), "real_keystrokes", False):
+            self.page.input_mode = "keys"
+
+    def _failed(self) -> bool:
+        """Whether this test (or one of its subtests) has failed so far."""
+        result = self._outcome.result
+        failures, errors = getattr(result, "failures", None), getattr(result, "errors", None)
+        if failures is None or errors is None:
+            # pytest's result object keeps no lists; the outcome flag is also False after a skip.
+            return not self._outcome.success
+        return any(test is self or getattr(test, "test_case", None) is self for test, _ in failures + errors)
+
+    def _release(self):
+        if self._failed():
+            path = recorder.dump(self.driver, self.id())
+            if path is not None:
+                sys.stderr.write(f"\nFlight record of {self.id()}: {path}\n")
+        with tracer.step("SessionPool.release", "reset"):
+            self.pool.release(self.driver, self.id())
+        tracer.test_finished()
+
+    def snapshot(self, settle: bool = True) -> PageSnapshot:
+        return self.page.snapshot(settle)
@@ -0,0 +1,172 @@
+"""Browserless smoke checks of the served app.
+
+Before any Chrome is started the runner fetches ``index.html`` over plain
+HTTP and checks that:
+
+* the page answers 200 with an HTML content type;
+* every script and stylesheet it references answers 200 with the right
+  content type, a ``Content-Length`` matching the body and, when the
+  served ``dist/`` is local, the size of the file on disk;
+* the JS bundle renders the DOM ids the UI tests locate (``REQUIRED_IDS``).
+
+The bundle is minified React, so ids are found both as literals
+(``id:"comission"``) and as account templates (``id:`${x.label}-sum```
+combined with every ``label:"rub"`` literal).
+
+Usage (from the ``tests`` directory)::
+
+    python -m support.smoke
+    python -m support.smoke --url http://localhost:8000
+"""
+import argparse
+import re
+import sys
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from support.server import DIST_DIR
+
+
+REQUEST_TIMEOUT = 2
+REQUIRED_IDS = ("rub-sum", "rub-reserved", "comission")
+EXPECTED_TYPES = {
+    ".html": "text/html",
+    ".js": "javascript",
+    ".mjs": "javascript",
+    ".css": "text/css",
+    ".svg": "image/svg+xml",
+}
+
+LITERAL_ID = re.compile(r"""\bid:["']([\w-]+)["']""")
+TEMPLATE_ID = re.compile(r"\bid:`\$\{\w+(?:\.\w+)*\}([\w-]+)`")
+LABEL = re.compile(r"""\blabel:["']([\w-]+)["']""")
+
+
+@dataclass(frozen=True)
+class Response:
+    status: int
+    content_type: str
+    content_length: int | None
+    body: bytes
+
+
+class AssetCollector(HTMLParser):
+    """Collects the script and stylesheet URLs of a page."""
+
+    def __init__(self):
+        super().__init__()
+        self.scripts: list[str] = []
+        self.stylesheets: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "script" and attrs.get("src"):
+            self.scripts.append(attrs["src"])
+        elif tag == "link" and attrs.get("href") and attrs.get("rel") in ("stylesheet", "modulepreload"):
+            (self.scripts if attrs["rel"] == "modulepreload" else self.stylesheets).append(attrs["href"])
+
+
+def fetch(url: str, timeout: float = REQUEST_TIMEOUT) -> Response:
+    # identity, so that sizes can be compared with the files on disk
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            status = response.status
+            headers = response.headers
+    except urllib.error.HTTPError as error:
+        body, status, headers = error.read(), error.code, error.headers
+    length = headers.get("Content-Length")
+    return Response(status, headers.get("Content-Type", ""), int(length) if length else None, body)
+
+
+def bundle_ids(source: str) -> set[str]:
+    """DOM ids a minified React bundle can render."""
+    ids = set(LITERAL_ID.findall(source))
+    labels = set(LABEL.findall(source))
+    for suffix in TEMPLATE_ID.findall(source):
+        ids.update(label + suffix for label in labels)
+    return ids
+
+
+def check_response(path: str, response: Response, root: Path | None) -> list[str]:
+    problems = []
+    if response.status != 200:
+        return [f"{path}: HTTP {response.status}"]
+    expected_type = EXPECTED_TYPES.get(Path(urlsplit(path).path).suffix or ".html")
+    if expected_type and expected_type not in response.content_type:
+        problems.append(f"{path}: content type {response.content_type!r}, expected {expected_type}")
+    if not response.body:
+        problems.append(f"{path}: empty body")
+    if response.content_length is not None and response.content_length != len(response.body):
+        problems.append(f"{path}: Content-Length {response.content_length}, body {len(response.body)} bytes")
+    if root is not None:
+        local = root / urlsplit(path).path.lstrip("/")
+        if local.is_file() and local.stat().st_size != len(response.body):
+            problems.append(f"{path}: {len(response.body)} bytes served, {local.stat().st_size} in {local}")
+    return problems
+
+
+def check_app(base_url: str, root: Path | None = None, required_ids=REQUIRED_IDS) -> list[str]:
+    """Problems found with the app at ``base_url``; empty if it looks servable.
+
+    ``root`` is the local ``dist/`` being served, for comparing sizes.
+    """
+    base_url = base_url.rstrip("/")
+    try:
+        index = fetch(f"{base_url}/")
+    except OSError as error:
+        return [f"/: {error}"]
+    problems = check_response("/index.html", index, root)
+    if problems:
+        return problems
+
+    collector = AssetCollector()
+    collector.feed(index.body.decode("utf-8", "replace"))
+    if not collector.scripts:
+        problems.append("/index.html: no script references")
+
+    ids = set()
+    for path in collector.scripts + collector.stylesheets:
+        try:
+            response = fetch(f"{base_url}{path}" if path.startswith("/") else f"{base_url}/{path}")
+        except OSError as error:
+            problems.append(f"{path}: {error}")
+            continue
+        problems.extend(check_response(path, response, root))
+        if path in collector.scripts and response.status == 200:
+            ids |= bundle_ids(response.body.decode("utf-8", "replace"))
+
+    missing = [element_id for element_id in required_ids if element_id not in ids]
+    if collector.scripts and missing:
+        problems.append(f"bundle does not render ids: {', '.join(missing)}")
+    return problems
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="check a running server instead of serving dist/")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.url:
+        problems = check_app(args.url)
+    else:
+        from support.server import serve_dist
+
+        with serve_dist() as base_url:
+            problems = check_app(base_url, DIST_DIR)
+    elapsed = time.perf_counter() - started
+    for problem in problems:
+        sys.stderr.write(f"SMOKE: {problem}\n")
+    sys.stderr.write(f"Smoke check {'FAILED' if problems else 'OK'} in {elapsed * 1000:.0f} ms\n")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""The whole transfer screen read in a single WebDriver round trip.
+
+Reading balances, reserves, the commission, the error and the send
+button one ``find_element`` at a time costs a round trip per field.
+``take_snapshot`` collects all of them in one ``execute_script`` call
+and returns a frozen dataclass that can be compared as a whole.
+"""
+from dataclasses import dataclass
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.waits import QUIET_MS, SETTLE_JS, SETTLE_TIMEOUT_MS
+
+
+ACCOUNTS = ("rub", "usd", "euro")
+CURRENCIES = {"₽": "rub", "$": "usd", "€": "euro"}
+
+# The app marks its error message only by an inline red colour.
+ERROR_JS = """
+function findError(root) {
+    return Array.from(root.querySelectorAll("span")).find((span) => span.style.color === "red") || null;
+}
+"""
+
+COLLECT_JS = ERROR_JS + """
+function collectSnapshot(accounts) {
+    const text = (element) => element ? element.textContent.trim() : null;
+    const balances = {};
+    for (const label of accounts) {
+        balances[label] = {
+            balance: text(document.getElementById(label + "-sum")),
+            reserved: text(document.getElementById(label + "-reserved")),
+        };
+    }
+
+    const panel = document.querySelector("#root > div > div > div:nth-child(2)");
+    const commission = document.getElementById("comission");
+    const inputs = panel ? panel.querySelectorAll("input") : [];
+    const error = panel ? findError(panel) : null;
+    return {
+        accounts: balances,
+        transfer_open: Boolean(panel),
+        card_number: inputs.length > 0 ? inputs[0].value : null,
+        amount: inputs.length > 1 ? inputs[1].value : null,
+        commission: text(commission),
+        currency: commission ? commission.parentElement.textContent.trim().slice(-1) : null,
+        error: text(error),
+        send_button: Boolean(panel && panel.querySelector("button")),
+    };
+}
+"""
+
+SNAPSHOT_SCRIPT = COLLECT_JS + "return collectSnapshot(arguments[0]);"
+
+SETTLED_SNAPSHOT_SCRIPT = SETTLE_JS + COLLECT_JS + """
+const [accounts, quietMs, timeoutMs, done] = arguments;
+whenSettled(quietMs, timeoutMs, () => done(collectSnapshot(accounts)));
+"""
+
+
+@dataclass(frozen=True)
+class AccountState:
+    balance: str | None
+    reserved: str | None
+
+
+@dataclass(frozen=True)
+class PageSnapshot:
+    accounts: dict[str, AccountState]
+    transfer_open: bool
+    card_number: str | None
+    amount: str | None
+    commission: str | None
+    error: str | None
+    send_button: bool
+    selected_account: str | None
+
+    @property
+    def rub(self) -> AccountState:
+        return self.accounts["rub"]
+
+    @property
+    def usd(self) -> AccountState:
+        return self.accounts["usd"]
+
+    @property
+    def euro(self) -> AccountState:
+        return self.accounts["euro"]
+
+
+def parse_snapshot(raw: dict) -> PageSnapshot:
+    """Build a ``PageSnapshot`` from the dictionary returned by the page script.
+
+    Balances keep the page's formatting minus the ``'`` thousand
+    separators, like the ``get_ruble_balance`` helpers.
+    """
+    def clean(value: str | None) -> str | None:
+        return value.replace("'", "") if value is not None else None
+
+    accounts = {
+        label: AccountState(balance=clean(values["balance"]), reserved=clean(values["reserved"]))
+        for label, values in raw["accounts"].items()
+    }
+    return PageSnapshot(
+        accounts=accounts,
+        transfer_open=raw["transfer_open"],
+        card_number=raw["card_number"],
+        amount=raw["amount"],
+        commission=raw["commission"],
+        error=raw["error"],
+        send_button=raw["send_button"],
+        # The selected card has no reliable marker of its own; the currency
+        # printed next to the commission identifies it once the amount is shown.
+        selected_account=CURRENCIES.get(raw["currency"]),
+    )
+
+
+def take_snapshot(driver: WebDriver, settle: bool = True) -> PageSnapshot:
+    """Read the whole screen, by default after the render has settled."""
+    if settle:
+        raw = driver.execute_async_script(SETTLED_SNAPSHOT_SCRIPT, list(ACCOUNTS), QUIET_MS, SETTLE_TIMEOUT_MS)
+    else:
+        raw = driver.execute_script(SNAPSHOT_SCRIPT, list(ACCOUNTS))
+    return parse_snapshot(raw)
@@ -0,0 +1,171 @@
+"""Opt-in per-step timing of the UI suite.
+
+Set ``TRACE_DIR`` to record how long every test, every page-object helper
+and every WebDriver command takes. Helpers are tagged with a kind -
+``startup``, ``load``, ``act``, ``wait`` or ``reset`` - so the summary can
+show time spent waiting versus acting. Each process writes one JSON trace
+into ``TRACE_DIR`` and prints a summary of the slowest tests, helpers and
+commands. Without ``TRACE_DIR`` the decorators return straight away.
+"""
+import atexit
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from pathlib import Path
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.recorder import recorder
+
+
+TRACE_DIR = os.environ.get("TRACE_DIR")
+SUMMARY_ROWS = 10
+
+
+class Tracer:
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.events: list[dict] = []
+        self.test: str | None = None
+        self._local = threading.local()
+
+    def _stack(self) -> list[str]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def test_started(self, test_id: str):
+        self.test = test_id
+        self._test_started = time.perf_counter()
+
+    def test_finished(self):
+        if not self.enabled or self.test is None:
+            return
+        self.events.append({
+            "type": "test",
+            "test": self.test,
+            "name": self.test,
+            "duration": time.perf_counter() - self._test_started,
+        })
+        self.test = None
+
+    @contextlib.contextmanager
+    def step(self, name: str, kind: str = "act", event_type: str = "step") -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        stack = self._stack()
+        depth = len(stack)
+        stack.append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            self.events.append({
+                "type": event_type,
+                "test": self.test,
+                "name": name,
+                "kind": kind,
+                "depth": depth,
+                "duration": time.perf_counter() - started,
+            })
+
+    def instrument(self, driver: WebDriver):
+        """Record every WebDriver command the session sends."""
+        if not self.enabled:
+            return
+        execute = driver.execute
+
+        @functools.wraps(execute)
+        def traced_execute(driver_command, params=None):
+            kind = "wait" if driver_command == "executeAsyncScript" else "act"
+            with self.step(driver_command, kind, event_type="command"):
+                return execute(driver_command, params)
+
+        driver.execute = traced_execute
+
+    def flush(self, summary: bool = True) -> Path | None:
+        """Write the events of this process to ``TRACE_DIR`` and print a summary."""
+        if not self.enabled or not self.events:
+            return None
+        directory = Path(TRACE_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"trace-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json"
+        path.write_text(json.dumps(self.events, indent=1, ensure_ascii=False), encoding="utf-8")
+        if summary:
+            print_summary(self.events)
+        self.events = []
+        return path
+
+
+def traced(kind: str = "act"):
+    """Record calls of a page-object method as a step of the given kind.
+
+    The call also goes into the flight recorder's ring buffer, which is
+    always on (see ``support.recorder``).
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            recorder.record(kind, method.__qualname__, args)
+            if not tracer.enabled:
+                return method(self, *args, **kwargs)
+            with tracer.step(f"{type(self).__name__}.{method.__name__}", kind):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def load_events(paths: list[Path]) -> list[dict]:
+    events = []
+    for path in paths:
+        events.extend(json.loads(path.read_text(encoding="utf-8")))
+    return events
+
+
+def aggregate(events: list[dict]) -> list[tuple[str, int, float, float]]:
+    """Return (name, calls, total, max) rows sorted by total time."""
+    totals = defaultdict(lambda: [0, 0.0, 0.0])
+    for event in events:
+        row = totals[event["name"]]
+        row[0] += 1
+        row[1] += event["duration"]
+        row[2] = max(row[2], event["duration"])
+    return sorted(((name, *row) for name, row in totals.items()), key=lambda row: row[2], reverse=True)
+
+
+def print_summary(events: list[dict], stream=sys.stderr):
+    tests = sorted((event for event in events if event["type"] == "test"), key=lambda event: -event["duration"])
+    steps = [event for event in events if event["type"] == "step"]
+    commands = [event for event in events if event["type"] == "command"]
+
+    stream.write("\nSlowest tests:\n")
+    for event in tests[:SUMMARY_ROWS]:
+        stream.write(f"  {event['duration']:8.3f}s  {event['name']}\n")
+
+    for title, rows in (("Slowest helpers", aggregate(steps)), ("Slowest WebDriver commands", aggregate(commands))):
+        stream.write(f"\n{title} (total / calls / max):\n")
+        for name, calls, total, longest in rows[:SUMMARY_ROWS]:
+            stream.write(f"  {total:8.3f}s  {calls:5d}  {longest:7.3f}s  {name}\n")
+
+    by_kind = defaultdict(float)
+    for event in steps + commands:
+        # Only outermost spans, so nested helpers and their commands are not counted twice.
+        if event["depth"] == 0:
+            by_kind[event["kind"]] += event["duration"]
+    stream.write("\nTime by kind:\n")
+    for kind, total in sorted(by_kind.items(), key=lambda item: -item[1]):
+        stream.write(f"  {total:8.3f}s  {kind}\n")
+
+
+tracer = Tracer(enabled=bool(TRACE_DIR))
+atexit.register(tracer.flush)
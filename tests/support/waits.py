@@ -0,0 +1,69 @@
+"""Presence checks that resolve as soon as the page stops changing.
+
+Waiting for an element with ``WebDriverWait`` only returns early when the
+element shows up; proving that something is *not* rendered used to cost
+the whole timeout. Here the page itself reports when React has finished
+rendering: a ``MutationObserver`` waits for a short period without DOM
+mutations, after which the DOM is inspected exactly once.
+"""
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+
+QUIET_MS = 50
+SETTLE_TIMEOUT_MS = 2000
+
+SETTLE_JS = """
+function whenSettled(quietMs, timeoutMs, callback) {
+    const root = document.getElementById("root");
+    const deadline = setTimeout(finish, timeoutMs);
+    let timer = null;
+    const observer = new MutationObserver(restart);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    restart();
+
+    function restart() {
+        clearTimeout(timer);
+        timer = setTimeout(() => {
+            if (root && root.childElementCount === 0) {
+                restart();
+            } else {
+                finish();
+            }
+        }, quietMs);
+    }
+
+    function finish() {
+        observer.disconnect();
+        clearTimeout(timer);
+        clearTimeout(deadline);
+        callback();
+    }
+}
+"""
+
+SETTLE_SCRIPT = SETTLE_JS + """
+const [quietMs, timeoutMs, done] = arguments;
+whenSettled(quietMs, timeoutMs, () => done(true));
+"""
+
+
+def wait_until_settled(driver: WebDriver, quiet_ms: int = QUIET_MS, timeout_ms: int = SETTLE_TIMEOUT_MS):
+    """Block until the DOM has not changed for ``quiet_ms`` (at most ``timeout_ms``)."""
+    driver.execute_async_script(SETTLE_SCRIPT, quiet_ms, timeout_ms)
+
+
+def expect_present(driver: WebDriver, locator: tuple[str, str]) -> WebElement | None:
+    """Return the element once rendering settles, or None if it is not on the page.
+
+    Relies on the session running without an implicit wait, otherwise
+    ``find_elements`` would block on a missing element.
+    """
+    wait_until_settled(driver)
+    elements = driver.find_elements(*locator)
+    return elements[0] if elements else None
+
+
+def expect_absent(driver: WebDriver, locator: tuple[str, str]) -> bool:
+    """Return True if the element is not on the page once rendering settles."""
+    return expect_present(driver, locator) is None
@@ -0,0 +1,216 @@
+"""Memory and process watchdog for the worker's browsers.
+
+After every test the session pool asks the watchdog to sample the warm
+browser: the resident memory of the chromedriver process tree (Chrome
+and all its helpers) and the page's JS heap. The samples form the
+per-test memory report of the runner. A session above
+``MAX_BROWSER_RSS_MB`` or ``MAX_JS_HEAP_MB`` is recycled before the next
+test inherits it.
+
+Every chromedriver the worker starts is remembered. When the worker
+finishes, ``reap`` kills whatever is still alive of those process trees,
+so a browser whose session was never released cannot outlive the run.
+
+Process trees are read and killed with ``psutil`` (in requirements.txt;
+on Windows the only way). Without it Linux falls back to ``/proc`` and
+POSIX signals; elsewhere RSS is simply not reported and only chromedriver
+itself can be killed (see ``support.session.discard``). The RSS of a tree
+counts shared pages once per process, so it is an upper bound.
+"""
+import os
+import signal
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from support.config import MAX_BROWSER_RSS_MB, MAX_JS_HEAP_MB
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+MB = 1024 * 1024
+PROC = Path("/proc")
+# Windows has no SIGKILL; there os.kill with SIGTERM is TerminateProcess.
+KILL_SIGNAL = getattr(signal, "SIGKILL", signal.SIGTERM)
+
+
+def _stat_fields(pid: int | str) -> list[str] | None:
+    """Fields of ``/proc/<pid>/stat`` after the command name, or None if the process is gone."""
+    try:
+        # The command name may contain spaces and parentheses; the fields after it do not.
+        fields = (PROC / str(pid) / "stat").read_text().rsplit(")", 1)[1].split()
+    except (OSError, IndexError):
+        return None
+    # A zombie has exited; only its parent has yet to collect the status.
+    return None if fields[0] == "Z" else fields
+
+
+def _children_by_parent() -> dict[int, list[int]]:
+    children = {}
+    for entry in PROC.glob("[0-9]*"):
+        fields = _stat_fields(entry.name)
+        if fields is not None:
+            children.setdefault(int(fields[1]), []).append(int(entry.name))
+    return children
+
+
+def _running(process) -> bool:
+    try:
+        return process.status() != psutil.STATUS_ZOMBIE
+    except psutil.Error:
+        return False
+
+
+def _psutil_tree(pid: int) -> list:
+    try:
+        root = psutil.Process(pid)
+        members = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return []
+    return [member for member in members if _running(member)]
+
+
+def process_tree(pid: int) -> list[int]:
+    """``pid`` and all its descendants that are still running."""
+    if psutil is not None:
+        return [member.pid for member in _psutil_tree(pid)]
+    if not PROC.is_dir() or _stat_fields(pid) is None:
+        return []
+    children = _children_by_parent()
+    tree, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
+
+
+def process_rss(pid: int) -> int:
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+    try:
+        resident_pages = int((PROC / str(pid) / "statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def tree_rss(pid: int) -> int | None:
+    """Resident memory of ``pid``'s process tree in bytes; None if it cannot be read here."""
+    if psutil is None and not PROC.is_dir():
+        return None
+    return sum(process_rss(member) for member in process_tree(pid))
+
+
+def start_time(pid: int) -> float | None:
+    """When ``pid`` started, to tell it apart from a later process reusing the id."""
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).create_time()
+        except psutil.Error:
+            return None
+    fields = _stat_fields(pid)
+    return float(fields[19]) if fields is not None else None
+
+
+def kill_tree(pid: int):
+    """Kill ``pid`` and its descendants, collected first so that none get re-parented away."""
+    if psutil is not None:
+        # psutil refuses to kill a process whose id has been reused since it was collected.
+        for member in reversed(_psutil_tree(pid)):
+            try:
+                member.kill()
+            except psutil.Error:
+                pass
+        return
+    for member in reversed(process_tree(pid)):
+        try:
+            os.kill(member, KILL_SIGNAL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+
+def driver_pid(driver: WebDriver) -> int | None:
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return process.pid if process is not None else None
+
+
+def js_heap(driver: WebDriver) -> int | None:
+    try:
+        return int(driver.execute_cdp_cmd("Runtime.getHeapUsage", {})["usedSize"])
+    except (WebDriverException, KeyError):
+        return None
+
+
+@dataclass(frozen=True)
+class MemorySample:
+    test: str
+    rss_mb: float | None
+    rss_delta_mb: float | None
+    js_heap_mb: float | None
+    recycled: bool
+
+    def to_record(self) -> dict:
+        return {key: value for key, value in asdict(self).items() if key != "test"}
+
+
+class Watchdog:
+    def __init__(self, max_rss_mb: float = MAX_BROWSER_RSS_MB, max_heap_mb: float = MAX_JS_HEAP_MB):
+        self.max_rss_mb = max_rss_mb
+        self.max_heap_mb = max_heap_mb
+        self.samples: list[MemorySample] = []
+        self._started: dict[int, float | None] = {}
+        self._last_rss: dict[int, float] = {}
+
+    def track(self, driver: WebDriver):
+        """Remember a freshly started browser so that ``reap`` can find it."""
+        pid = driver_pid(driver)
+        if pid is not None:
+            self._started[pid] = start_time(pid)
+            rss = tree_rss(pid)
+            if rss is not None:
+                self._last_rss[pid] = rss / MB
+
+    def over_budget(self, driver: WebDriver, test_id: str) -> bool:
+        """Sample ``driver`` after ``test_id``; True if it should be recycled."""
+        pid = driver_pid(driver)
+        rss = tree_rss(pid) if pid is not None else None
+        rss_mb = rss / MB if rss is not None else None
+        heap = js_heap(driver)
+        heap_mb = heap / MB if heap is not None else None
+
+        previous = self._last_rss.get(pid)
+        delta_mb = rss_mb - previous if rss_mb is not None and previous is not None else None
+        if rss_mb is not None:
+            self._last_rss[pid] = rss_mb
+
+        recycle = (rss_mb is not None and rss_mb > self.max_rss_mb) or (
+            heap_mb is not None and heap_mb > self.max_heap_mb
+        )
+        self.samples.append(MemorySample(test_id, rss_mb, delta_mb, heap_mb, recycle))
+        return recycle
+
+    def forget(self, driver: WebDriver):
+        self._last_rss.pop(driver_pid(driver), None)
+
+    def reap(self) -> list[int]:
+        """Kill what is left of every browser this process started; returns the killed roots."""
+        killed = []
+        for pid, started in sorted(self._started.items()):
+            if started is not None and start_time(pid) == started:
+                kill_tree(pid)
+                killed.append(pid)
+        self._started.clear()
+        self._last_rss.clear()
+        return killed
+
+
+watchdog = Watchdog()
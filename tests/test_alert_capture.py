@@ -0,0 +1,48 @@
+from unittest import mock
+
+from selenium.common.exceptions import NoAlertPresentException
+
+from support.alerts import install_alert_capture, wait_for_alerts
+from support.devtools import remove_document_script
+from support.session import BrowserTestCase
+
+
+CARD = "4111111111111111"
+MESSAGE = f"Перевод 1000 ₽ на карту {CARD} принят банком!"
+
+
+class TestAlertCapture(BrowserTestCase):
+    """Режим ALERT_MODE=capture: сообщения alert собираются на странице, диалог не открывается."""
+
+    def setUp(self):
+        super().setUp()
+        identifier = install_alert_capture(self.driver)
+        self.addCleanup(remove_document_script, self.driver, identifier)
+        patcher = mock.patch("support.pages.ALERT_MODE", "capture")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.page.open(33000, 1000)
+
+    def send_transfer(self):
+        self.page.enable_rubles()
+        self.page.card_input(CARD)
+        self.page.amount_input("1000")
+        self.page.send_button().click()
+
+    def test_accept_alert_returns_captured_message(self):
+        self.send_transfer()
+        self.assertEqual(self.page.accept_alert(), MESSAGE)
+        with self.assertRaises(NoAlertPresentException):
+            self.driver.switch_to.alert.text
+
+    def test_captured_alerts_keep_their_order(self):
+        self.send_transfer()
+        self.page.send_button().click()
+        self.assertEqual(wait_for_alerts(self.driver, count=2), [MESSAGE, MESSAGE])
+        self.assertEqual(self.page.captured_alerts(), [])
+
+    def test_alert_after_timed_out_wait(self):
+        with self.assertRaises(NoAlertPresentException):
+            wait_for_alerts(self.driver, timeout_ms=100)
+        self.send_transfer()
+        self.assertEqual(wait_for_alerts(self.driver), [MESSAGE])
@@ -0,0 +1,66 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+from support.benchmark import NOISE_FLOOR_MS, compare, judge, parse_args, percentile
+
+
+def stats(p50: float) -> dict:
+    return {"p50": p50, "p90": p50, "p95": p50, "max": p50, "count": 5}
+
+
+class TestBenchmarkStatistics(unittest.TestCase):
+    """Перцентили и сравнение с baseline без запуска браузера."""
+
+    def test_percentile_interpolates(self):
+        values = [40.0, 10.0, 30.0, 20.0]
+        self.assertEqual(percentile(values, 0), 10.0)
+        self.assertEqual(percentile(values, 50), 25.0)
+        self.assertEqual(percentile(values, 100), 40.0)
+        self.assertAlmostEqual(percentile(values, 90), 37.0)
+        self.assertEqual(percentile([7.0], 95), 7.0)
+
+    def test_slowdown_beyond_ratio_is_a_regression(self):
+        regressions = compare({"page_load": stats(130.0)}, {"page_load": stats(100.0)}, max_slowdown=0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("page_load: p50 130.0 ms > 125.0 ms"))
+        self.assertEqual(compare({"page_load": stats(124.0)}, {"page_load": stats(100.0)}, 0.25), [])
+
+    def test_noise_floor_protects_fast_metrics(self):
+        baseline = {"read_commission": stats(2.0)}
+        self.assertEqual(compare({"read_commission": stats(2.0 + NOISE_FLOOR_MS)}, baseline, 0.25), [])
+        self.assertEqual(len(compare({"read_commission": stats(2.1 + NOISE_FLOOR_MS)}, baseline, 0.25)), 1)
+
+    def test_metrics_missing_from_the_baseline_are_ignored(self):
+        self.assertEqual(compare({"new_metric": stats(1000.0)}, {}, 0.25), [])
+
+
+class TestBaselineGate(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.baseline = Path(directory.name) / "baseline.json"
+        self.result = {"runs": 1, "profile": "fast", "metrics": {"page_load": stats(100.0)}}
+
+    def judge(self, *argv: str, environment: dict | None = None) -> int:
+        outside_ci = {name: value for name, value in os.environ.items() if name != "CI"}
+        with mock.patch.dict(os.environ, outside_ci | (environment or {}), clear=True), redirect_stderr(io.StringIO()):
+            return judge(self.result, parse_args(["--baseline", str(self.baseline), *argv]))
+
+    def test_missing_baseline_fails_under_ci(self):
+        self.assertEqual(self.judge(environment={"CI": "true"}), 1)
+        self.assertEqual(self.judge("--require-baseline"), 1)
+        self.assertEqual(self.judge(), 0)
+        self.assertEqual(self.judge("--no-require-baseline", environment={"CI": "true"}), 0)
+
+    def test_update_then_compare(self):
+        self.assertEqual(self.judge("--update-baseline"), 0)
+        self.assertEqual(json.loads(self.baseline.read_text(encoding="utf-8")), self.result)
+        self.assertEqual(self.judge(environment={"CI": "true"}), 0)
+        self.result["metrics"]["page_load"] = stats(200.0)
+        self.assertEqual(self.judge(), 1)
@@ -1,98 +1,42 @@
-import unittest
-
-from selenium import webdriver
-from selenium.webdriver import ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-
-class TestKolegova(unittest.TestCase):
-    def setUp(self) -> None:
-        chrome_options = ChromeOptions()
-
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-
-        service = ChromeService(executable_path=ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.implicitly_wait(60)
-
-    def tearDown(self) -> None:
-        self.driver.quit()
-
-    def find_element(self, path: str) -> WebElement:
-        entity = WebDriverWait(self.driver, 60).until(
-            EC.element_to_be_clickable(
-                (
-                    By.XPATH,
-                    path
-                )
-            )
-        )
-        return entity
 
+from support.config import BASE_URL
+from support.session import BrowserTestCase
+
+
+class TestKolegova(BrowserTestCase):
     def enable_rubles(self):
-        rubles_field = self.find_element('//*[@id="root"]/div/div/div[1]/div[1]/div')
-        rubles_field.click()
+        self.page.enable_rubles()
 
     def enable_dollars(self):
-        dollars_field = self.find_element('//*[@id="root"]/div/div/div[1]/div[2]/div')
-        dollars_field.click()
+        self.page.enable_dollars()
 
     def card_input(self, card_number: str) -> str:
-        input_field = self.find_element('//*[@id="root"]/div/div/div[2]/input')
-        input_field.send_keys(card_number)
-        value = input_field.get_attribute("value")
-        return value.replace(" ", "")
+        return self.page.card_input(card_number)
 
     def amount_input(self, amount: str) -> str:
-        input_field = self.find_element('//*[@id="root"]/div/div/div[2]/input[2]')
-        input_field.clear()
-        input_field.send_keys(amount)
-        value = input_field.get_attribute("value")
-        return value.replace(" ", "")
+        return self.page.amount_input(amount)
 
     def get_send_button(self) -> WebElement | None:
-        try:
-            send_button = self.find_element('//*[@id="root"]/div/div/div[2]/button/span')
-            return send_button
-        except:
-            return None
+        return self.page.send_button()
 
     def send_money(self, button: WebElement):
         button.click()
 
     def get_exception_message(self) -> WebElement | None:
-        try:
-            exception_message = self.find_element('//*[@id="root"]/div/div/div[2]/span[2]')
-            return exception_message
-        except:
-            return None
+        return self.page.error_message()
 
     def get_fee(self) -> str:
-        fee_el = self.find_element('//*[@id="comission"]')
-        value = fee_el.text
-        return value.replace(" ", "")
+        return self.page.commission()
 
     def get_toast(self) -> str:
-        driver = self.driver
-        alert = driver.switch_to.alert
-        alert_text = alert.text
-        alert.accept()
-        return alert_text
+        return self.page.accept_alert()
 
     def test_tc_001_commission_recalculation(self):
         card = "5559000000000000"
         money_1 = "5000"
         money_2 = "1000"
-        self.driver.get("http://localhost:8000/?balance=33000&reserved=1000")
+        self.driver.get(f"{BASE_URL}/?balance=33000&reserved=1000")
         self.enable_rubles()
 
         self.card_input(card)
@@ -110,7 +54,7 @@ class TestKolegova(unittest.TestCase):
         card = "4111111111111111"
         money = "1000"
 
-        self.driver.get("http://localhost:8000/?balance=33000&reserved=1000")
+        self.driver.get(f"{BASE_URL}/?balance=33000&reserved=1000")
         self.enable_rubles()
 
         self.card_input(card)
@@ -125,7 +69,7 @@ class TestKolegova(unittest.TestCase):
         card = "4000123456789000"
         money = "3111"
 
-        self.driver.get("http://localhost:8000/?balance=33000&reserved=1000")
+        self.driver.get(f"{BASE_URL}/?balance=33000&reserved=1000")
         self.enable_dollars()
         self.card_input(card)
         self.amount_input(money)
@@ -139,7 +83,7 @@ class TestKolegova(unittest.TestCase):
         card = "1234567890901122"
         money = "99"
 
-        self.driver.get("http://localhost:8000/?balance=33000&reserved=1000")
+        self.driver.get(f"{BASE_URL}/?balance=33000&reserved=1000")
 
         self.enable_rubles()
         self.card_input(card)
@@ -147,7 +91,7 @@ class TestKolegova(unittest.TestCase):
         self.assertTrue(self.get_fee().startswith("9"))
 
     def test_tc_005_card_number_length_validation(self):
-        self.driver.get("http://localhost:8000/?balance=33000&reserved=1000")
+        self.driver.get(f"{BASE_URL}/?balance=33000&reserved=1000")
         self.enable_rubles()
 
         for card, should_pass in [
@@ -0,0 +1,89 @@
+import math
+import unittest
+
+import trio
+
+from support.bidi import STATE_CHANNEL, BidiClient, BidiTestCase, ContextRouter, run_transfers, state_context, wait_for
+
+
+class TestBidiTransfers(BidiTestCase):
+    # ---------- TC-002 ---------- #
+    def test_transfers_in_parallel_tabs(self):
+        """
+        Один и тот же перевод рублей, открытый одновременно в нескольких
+        вкладках одного процесса: в каждой вкладке комиссия 100 ₽ и
+        сообщение о принятом переводе.
+        """
+        cards = ["4111111111111111", "5559000000000000", "1234567890901122", "4000123456789000"]
+        transfers = [dict(balance=33000, reserved=1000, card=card, amount="1000") for card in cards]
+        results = self.run_bidi(run_transfers, transfers)
+        for card, result in zip(cards, results):
+            with self.subTest(card=card):
+                self.assertEqual(result["commission"], "100")
+                self.assertTrue(result["sent"], "Кнопка перевода должна быть доступна")
+                self.assertEqual(result["alert"], f"Перевод 1000 ₽ на карту {card} принят банком!")
+
+    def test_overdraft_in_parallel_tabs(self):
+        transfers = [dict(balance=1000, reserved=0, card="5559000000000000", amount=amount) for amount in ("950", "1000")]
+        results = self.run_bidi(run_transfers, transfers)
+        for result in results:
+            self.assertFalse(result["sent"], "Перевод больше доступного остатка не должен отправляться")
+            self.assertIsNone(result["alert"])
+
+
+class SilentWebsocket:
+    """A browser that accepts commands and never answers."""
+
+    async def send_message(self, message):
+        pass
+
+
+def state_message(context: str, reason: str, commission: str | None, channel: str = STATE_CHANNEL) -> dict:
+    data = {"type": "object", "value": [
+        ["reason", {"type": "string", "value": reason}],
+        ["accounts", {"type": "array", "value": [{"type": "string", "value": "rub"}]}],
+        ["commission", {"type": "null"} if commission is None else {"type": "string", "value": commission}],
+    ]}
+    return {"channel": channel, "data": data, "source": {"realm": "r", "context": context}}
+
+
+class TestBidiEvents(unittest.TestCase):
+    """Маршрутизация событий BiDi и таймауты без браузера."""
+
+    def test_command_without_response_times_out(self):
+        client = BidiClient(SilentWebsocket())
+
+        async def main():
+            with self.assertRaises(trio.TooSlowError):
+                await client.execute("browsingContext.navigate", {}, timeout=0.05)
+
+        trio.run(main)
+        self.assertEqual(client._pending, {})
+
+    def test_states_are_routed_to_their_context(self):
+        async def main():
+            send_channel, receive_channel = trio.open_memory_channel(math.inf)
+            router = ContextRouter(receive_channel, state_context)
+            first, second = router.channel("first"), router.channel("second")
+            for message in (
+                state_message("first", "change", None),
+                state_message("second", "filled", "10"),
+                state_message("first", "filled", "100", channel="other"),
+                state_message("first", "filled", "100"),
+            ):
+                send_channel.send_nowait(message)
+            send_channel.close()
+            await router.run()
+            filled = await wait_for(first, lambda state: state["reason"] == "filled")
+            self.assertEqual(filled, {"reason": "filled", "accounts": ["rub"], "commission": "100"})
+            self.assertEqual((await wait_for(second, lambda state: True))["commission"], "10")
+
+        trio.run(main)
+
+    def test_missing_event_times_out(self):
+        async def main():
+            _, receive_channel = trio.open_memory_channel(math.inf)
+            with self.assertRaises(trio.TooSlowError):
+                await wait_for(receive_channel, lambda prompt: True, timeout=0.05)
+
+        trio.run(main)
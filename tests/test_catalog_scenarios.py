@@ -0,0 +1,105 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from support.catalog import (
+    DEFAULT_BALANCE,
+    compare_sent,
+    compare_snapshot,
+    group_scenarios,
+    load_scenarios,
+)
+from support.oracle import check_cases
+from support.session import BrowserTestCase
+from support.waits import wait_until_settled
+
+
+class TestCatalogParser(unittest.TestCase):
+    """Разбор markdown-каталогов тест-кейсов в таблицу сценариев."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.scenarios = {scenario.id: scenario for scenario in load_scenarios(cache_file=None)}
+
+    def test_every_catalog_case_is_loaded(self):
+        expected = {f"TC-{number:03}" for number in range(1, 16)} | {f"berezovskaia-{number}" for number in range(1, 6)}
+        self.assertEqual(set(self.scenarios), expected)
+
+    def test_preconditions_and_expected_result(self):
+        scenario = self.scenarios["TC-011"]
+        self.assertEqual((scenario.balance, scenario.reserved, scenario.amount), (1100, 0, "1000"))
+        self.assertTrue(scenario.allowed)
+        self.assertEqual(scenario.balance_after, 0)
+
+    def test_commission_and_alert(self):
+        self.assertEqual(self.scenarios["TC-012"].commission, 123)
+        self.assertEqual(self.scenarios["TC-012"].amount, "1234,56")
+        self.assertEqual(self.scenarios["TC-002"].alert, "Перевод 1000 ₽ на карту 4111111111111111 принят банком!")
+
+    def test_new_value_of_available_balance(self):
+        scenario = self.scenarios["TC-009"]
+        self.assertEqual((scenario.balance, scenario.reserved), (30000, 2000))
+        self.assertEqual((scenario.balance_after, scenario.available_after), (None, 26900))
+        self.assertEqual(compare_sent(scenario, None, "28900", "2000"), [])
+        self.assertEqual(len(compare_sent(scenario, None, "30000", "2000")), 1)
+
+    def test_thousand_separator_is_kept_when_it_is_the_point(self):
+        self.assertEqual(self.scenarios["TC-013"].amount, "1 000")
+
+    def test_fixed_accounts_share_the_default_page(self):
+        for tc_id, account in [("TC-003", "usd"), ("TC-008", "euro")]:
+            with self.subTest(tc_id):
+                scenario = self.scenarios[tc_id]
+                self.assertEqual(scenario.account, account)
+                self.assertEqual(scenario.balance, DEFAULT_BALANCE)
+                self.assertFalse(scenario.allowed)
+
+    def test_cases_without_checkable_data_are_skipped(self):
+        for tc_id in ["TC-005", "TC-006", "TC-015"]:
+            with self.subTest(tc_id):
+                self.assertIsNotNone(self.scenarios[tc_id].skip_reason)
+
+    def test_edited_catalog_invalidates_the_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            catalog = Path(directory) / "new.md"
+            cache_file = Path(directory) / "cache.json"
+            catalog.write_text("### TC-100 — Новый\n\n**Тестовые данные:**\n* Сумма: `500 ₽`\n", encoding="utf-8")
+            first, = load_scenarios([catalog], cache_file)
+            self.assertIsNotNone(first.skip_reason)
+            catalog.write_text(
+                catalog.read_text(encoding="utf-8") + "\n**Ожидаемый результат:**\nКомиссия = `50 ₽`\n",
+                encoding="utf-8",
+            )
+            scenarios = load_scenarios([catalog], cache_file)
+        self.assertEqual([(scenario.id, scenario.commission) for scenario in scenarios], [("TC-100", 50)])
+
+
+class TestCatalogScenarios(BrowserTestCase):
+    def test_catalog_scenarios(self):
+        """Все сценарии каталогов: одна загрузка страницы на пару баланс/резерв."""
+        for (balance, reserved), group in group_scenarios(load_scenarios()).items():
+            runnable = [scenario for scenario in group if scenario.skip_reason is None]
+            for scenario in group:
+                if scenario.skip_reason is not None:
+                    with self.subTest(scenario.id):
+                        self.skipTest(scenario.skip_reason)
+            if not runnable:
+                continue
+
+            self.page.open(balance, reserved)
+            wait_until_settled(self.driver)
+            for scenario in runnable:
+                with self.subTest(scenario.id, title=scenario.title):
+                    snapshot, = check_cases(self.driver, [scenario.case()])
+                    mismatches = compare_snapshot(scenario, snapshot)
+                    if scenario.sends:
+                        button = self.page.send_button()
+                        if button is None:
+                            mismatches.append("send button hidden, the transfer could not be sent")
+                        else:
+                            button.click()
+                            alert = self.page.accept_alert()
+                            mismatches.extend(compare_sent(
+                                scenario, alert, self.page.balance(scenario.account), self.page.reserved(scenario.account)
+                            ))
+                    self.assertFalse(mismatches, "\n".join(mismatches))
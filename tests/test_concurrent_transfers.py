@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+
+from support import concurrency
+from support.concurrency import Transfer, run_in_sessions, run_in_tabs
+from support.config import BASE_URL
+from support.drivers import create_driver
+from support.session import BrowserTestCase
+
+
+class TestConcurrentTransfers(BrowserTestCase):
+    # ---------- TC-015 ---------- #
+    def test_parallel_transfers_from_two_tabs(self):
+        """
+        Параллельный перевод из двух вкладок:
+        1) 2 000 ₽ проходит.
+        2) 3 000 ₽ во второй вкладке должен быть отклонён.
+        """
+        transfers = [Transfer("5559000000000000", "2000"), Transfer("5559000000000000", "3000")]
+        for order in ([0, 1], [1, 0]):
+            with self.subTest(order=order):
+                run = run_in_tabs(self.driver, f"{BASE_URL}/?balance=5000&reserved=0", transfers, order)
+                first, second = run.outcomes
+                self.assertTrue(first.accepted, "Перевод 2 000 ₽ должен пройти")
+                self.assertFalse(second.accepted, "Перевод 3 000 ₽ во второй вкладке должен быть отклонён")
+
+    def test_simultaneous_transfers_from_two_sessions(self):
+        transfers = [Transfer("5559000000000000", "2000"), Transfer("4111111111111111", "3000")]
+        run = run_in_sessions(create_driver, f"{BASE_URL}/?balance=5000&reserved=0", transfers)
+        accepted = [outcome for outcome in run.outcomes if outcome.accepted]
+        self.assertEqual(len(accepted), 1, "Only one of the simultaneous transfers fits into the balance")
+
+
+class TestHarnessCleanup(unittest.TestCase):
+    """Заглушка alert снимается со всех вкладок даже после ошибки; браузер заменён заглушкой."""
+
+    def test_alert_capture_removed_after_failure(self):
+        driver = mock.MagicMock()
+        type(driver).current_window_handle = mock.PropertyMock(side_effect=["main", "second"])
+        with (
+            mock.patch.object(concurrency, "install_alert_capture", side_effect=["stub-1", "stub-2"]),
+            mock.patch.object(concurrency, "remove_document_script") as remove,
+            mock.patch.object(concurrency, "prepare", side_effect=[None, RuntimeError("page did not load")]),
+        ):
+            with self.assertRaises(RuntimeError):
+                run_in_tabs(driver, "url", [Transfer("1", "1"), Transfer("2", "2")])
+        self.assertEqual(remove.call_args_list, [mock.call(driver, "stub-1"), mock.call(driver, "stub-2")])
+        driver.switch_to.window.assert_called_with("main")
@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from support import drivers
+from support.drivers import chromedriver_path
+
+
+class TestChromedriverPath(unittest.TestCase):
+    """Порядок поиска ChromeDriver и его кэш на диске; сеть и Chrome заменены заглушками."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.cache_file = self.directory / "cache" / "chromedriver.json"
+        self.downloaded = self.directory / "downloaded-chromedriver"
+        self.downloaded.write_text("", encoding="utf-8")
+
+        environment = {name: value for name, value in os.environ.items() if name != "CHROMEDRIVER_PATH"}
+        self.manager = mock.Mock()
+        self.manager.return_value.install.return_value = str(self.downloaded)
+        self.version = mock.Mock(return_value="120.0.6099.109")
+        self.which = mock.Mock(return_value="/usr/bin/chromedriver")
+        for patcher in (
+            mock.patch.dict(os.environ, environment, clear=True),
+            mock.patch.object(drivers, "CACHE_DIR", self.cache_file.parent),
+            mock.patch.object(drivers, "CACHE_FILE", self.cache_file),
+            mock.patch.object(drivers, "ChromeDriverManager", self.manager),
+            mock.patch.object(drivers, "installed_chrome_version", self.version),
+            mock.patch.object(drivers.shutil, "which", self.which),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        chromedriver_path.cache_clear()
+        self.addCleanup(chromedriver_path.cache_clear)
+
+    def cached(self, version: str, path: Path):
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_file.write_text(json.dumps({version: str(path)}), encoding="utf-8")
+
+    def read_cache(self) -> dict:
+        return json.loads(self.cache_file.read_text(encoding="utf-8"))
+
+    def test_environment_variable_comes_first(self):
+        self.cached("120.0.6099.109", self.downloaded)
+        with mock.patch.dict(os.environ, {"CHROMEDRIVER_PATH": "/opt/chromedriver"}):
+            self.assertEqual(chromedriver_path(), "/opt/chromedriver")
+        self.version.assert_not_called()
+        self.manager.assert_not_called()
+
+    def test_cache_of_the_installed_version(self):
+        cached = self.directory / "cached-chromedriver"
+        cached.write_text("", encoding="utf-8")
+        self.cached("120.0.6099.109", cached)
+        self.assertEqual(chromedriver_path(), str(cached))
+        self.manager.assert_not_called()
+
+    def test_download_is_written_to_the_cache(self):
+        self.cached("119.0.6045.105", self.directory / "old-chromedriver")
+        self.assertEqual(chromedriver_path(), str(self.downloaded))
+        self.assertEqual(self.read_cache(), {
+            "119.0.6045.105": str(self.directory / "old-chromedriver"),
+            "120.0.6099.109": str(self.downloaded),
+        })
+
+    def test_cached_file_that_is_gone_is_downloaded_again(self):
+        self.cached("120.0.6099.109", self.directory / "deleted-chromedriver")
+        self.assertEqual(chromedriver_path(), str(self.downloaded))
+        self.manager.return_value.install.assert_called_once_with()
+
+    def test_unknown_chrome_version_bypasses_the_cache(self):
+        self.version.return_value = None
+        self.cached("unknown", self.directory / "stale-chromedriver")
+        (self.directory / "stale-chromedriver").write_text("", encoding="utf-8")
+        self.assertEqual(chromedriver_path(), str(self.downloaded))
+        self.assertEqual(self.read_cache(), {"unknown": str(self.directory / "stale-chromedriver")})
+
+    def test_path_is_the_last_resort(self):
+        self.manager.return_value.install.side_effect = ConnectionError("offline")
+        self.assertEqual(chromedriver_path(), "/usr/bin/chromedriver")
+        self.assertFalse(self.cache_file.exists())
+
+    def test_nothing_found(self):
+        self.manager.return_value.install.side_effect = ConnectionError("offline")
+        self.which.return_value = None
+        with self.assertRaisesRegex(RuntimeError, "CHROMEDRIVER_PATH"):
+            chromedriver_path()
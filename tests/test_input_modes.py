@@ -0,0 +1,29 @@
+from support.session import BrowserTestCase
+from support.snapshot import PageSnapshot
+
+
+CARD = "4111111111111111"
+
+
+class TestInputModes(BrowserTestCase):
+    """Быстрый ввод (INPUT_MODE=fast) и настоящие нажатия клавиш дают один и тот же экран."""
+
+    def fill_sequence(self, input_mode: str) -> list[PageSnapshot]:
+        self.page.input_mode = input_mode
+        self.page.open(33000, 1000)
+        self.page.enable_rubles()
+        self.page.card_input(CARD, clear=True)
+        snapshots = []
+        for amount in ("500", "1000", "1000"):
+            self.page.amount_input(amount)
+            snapshots.append(self.snapshot())
+        # Switching accounts remounts the amount input with its default value, 1000.
+        self.page.amount_input("500")
+        self.page.enable_dollars()
+        self.page.enable_rubles()
+        self.page.amount_input("1000")
+        snapshots.append(self.snapshot())
+        return snapshots
+
+    def test_fast_and_keys_modes_agree(self):
+        self.assertEqual(self.fill_sequence("fast"), self.fill_sequence("keys"))
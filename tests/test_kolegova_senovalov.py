@@ -1,100 +1,40 @@
-import unittest
-
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver import ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-
-BASE_URL = "http://localhost:8000"
-
-
-class TestSenovalov(unittest.TestCase):
-    def setUp(self) -> None:
-        chrome_options = ChromeOptions()
 
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
+from support.config import BASE_URL
+from support.inputs import real_keystrokes
+from support.session import BrowserTestCase
 
-        service = ChromeService(executable_path=ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.implicitly_wait(60)
-
-    def tearDown(self) -> None:
-        self.driver.quit()
-
-    def find_element(self, path: str) -> WebElement:
-        entity = WebDriverWait(self.driver, 60).until(
-            EC.element_to_be_clickable(
-                (
-                    By.XPATH,
-                    path
-                )
-            )
-        )
-        return entity
 
+class TestSenovalov(BrowserTestCase):
     def open_app(self, balance: int | float, reserved: int | float):
-        url = f"{BASE_URL}/?balance={balance}&reserved={reserved}"
-        self.driver.get(url)
+        self.page.open(balance, reserved)
 
     def enable_rubles(self):
-        rubles_field = self.find_element('//*[@id="root"]/div/div/div[1]/div[1]/div')
-        rubles_field.click()
+        self.page.enable_rubles()
 
     def card_input(self, card_number: str) -> str:
-        field = self.find_element('//*[@id="root"]/div/div/div[2]/input')
-        field.clear()
-        field.send_keys(card_number)
-        return field.get_attribute("value").replace(" ", "")
+        return self.page.card_input(card_number, clear=True)
 
     def amount_input(self, amount: str) -> str:
-        field = self.find_element('//*[@id="root"]/div/div/div[2]/input[2]')
-        field.clear()
-        field.send_keys(amount)
-        return field.get_attribute("value").replace(" ", "")
+        return self.page.amount_input(amount)
 
     def get_fee_value(self) -> str:
-        fee_el = self.find_element('//*[@id="comission"]')
-        value = fee_el.text
-        return value.replace(" ", "")
+        return self.page.commission()
 
     def get_send_button(self) -> WebElement | None:
-        try:
-            send_button = self.find_element('//*[@id="root"]/div/div/div[2]/button/span')
-            return send_button
-        except:
-            return None
+        return self.page.send_button()
 
     def send_money(self, button: WebElement):
         button.click()
 
     def get_exception_message(self) -> WebElement | None:
-        try:
-            exception_message = self.find_element('//*[@id="root"]/div/div/div[2]/span[2]')
-            return exception_message
-        except:
-            return None
+        return self.page.error_message()
 
     def get_toast(self) -> str:
-        driver = self.driver
-        alert = driver.switch_to.alert
-        alert_text = alert.text
-        alert.accept()
-        return alert_text
+        return self.page.accept_alert()
 
     def get_ruble_balance(self) -> str:
-        ruble_balance = self.find_element('//*[@id="rub-sum"]')
-        value = ruble_balance.text
-        value = value.replace("'", "")
-        return value
+        return self.page.balance("rub")
 
     def is_decimal_string(self, s):
         try:
@@ -128,6 +68,7 @@ class TestSenovalov(unittest.TestCase):
         self.assertTrue(balance_el == 0, "Баланс должен быть равен 0")
 
     # ---------- TC-012 ---------- #
+    @real_keystrokes
     def test_amount_with_comma(self):
         self.open_app(balance=10000, reserved=0)
         self.enable_rubles()
@@ -144,6 +85,7 @@ class TestSenovalov(unittest.TestCase):
         self.assertIn("принят", toast.lower())
 
     # ---------- TC-013 ---------- #
+    @real_keystrokes
     def test_amount_with_thousand_separator(self):
         self.open_app(balance=10000, reserved=0)
         self.enable_rubles()
@@ -159,6 +101,7 @@ class TestSenovalov(unittest.TestCase):
         self.assertIn("принят", self.get_toast().lower())
 
     # ---------- TC-014 ---------- #
+    @real_keystrokes
     def test_amount_more_than_two_decimals(self):
         self.open_app(balance=10000, reserved=0)
         self.enable_rubles()
@@ -182,7 +125,7 @@ class TestSenovalov(unittest.TestCase):
         2) 3 000 ₽ во второй вкладке должен быть отклонён.
         """
         # первая вкладка
-        self.driver.get(url='http://localhost:8000/?balance=1000,50&reserved=2000')
+        self.driver.get(url=f'{BASE_URL}/?balance=1000,50&reserved=2000')
 
         ruble_balance = self.get_ruble_balance()
         self.assertTrue(self.is_decimal_string(ruble_balance))
@@ -194,7 +137,7 @@ class TestSenovalov(unittest.TestCase):
         1) 2 000 ₽ проходит.
         2) 3 000 ₽ во второй вкладке должен быть отклонён.
         """
-        self.driver.get(url='http://localhost:8000/?balance=1000.50&reserved=2000')
+        self.driver.get(url=f'{BASE_URL}/?balance=1000.50&reserved=2000')
 
         ruble_balance = self.get_ruble_balance()
         self.assertTrue(self.is_decimal_string(ruble_balance))
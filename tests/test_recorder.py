@@ -0,0 +1,35 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from support.recorder import FlightRecorder
+
+
+class TestFlightRecorder(unittest.TestCase):
+    """Буфер бортового самописца без браузера."""
+
+    def test_keeps_only_the_latest_steps(self):
+        recorder = FlightRecorder(directory="", capacity=3)
+        recorder.start("test_x")
+        for number in range(5):
+            recorder.record("act", "TransferPage.amount_input", (str(number),))
+        self.assertEqual([args for *_, args in recorder.events], [("2",), ("3",), ("4",)])
+
+    def test_dump_merges_page_events_by_time(self):
+        with tempfile.TemporaryDirectory() as directory:
+            recorder = FlightRecorder(directory=directory, capacity=10)
+            recorder.start("test_y")
+            recorder.record("act", "TransferPage.card_input", ("5559000000000000",))
+            path = recorder.dump(None, "module.Class.test_y")
+            timeline = json.loads((path / "flight.json").read_text(encoding="utf-8"))
+            self.assertEqual(Path(path).parent, Path(directory))
+        self.assertEqual([event["kind"] for event in timeline], ["test", "act"])
+        self.assertEqual(timeline[1]["args"], ["'5559000000000000'"])
+        self.assertEqual(
+            [event["kind"] for event in recorder.timeline([{"time": 0, "kind": "console"}])],
+            ["console", "test", "act"],
+        )
+
+    def test_disabled_without_directory(self):
+        self.assertIsNone(FlightRecorder(directory="").dump(None, "test_z"))
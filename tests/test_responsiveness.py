@@ -0,0 +1,81 @@
+from support.config import BASE_URL, CPU_THROTTLE
+from support.devtools import remove_document_script
+from support.perf import (
+    browser_metrics,
+    disable_metrics,
+    first_render,
+    input_latency,
+    install_probe,
+    metrics_delta,
+    set_cpu_throttling,
+)
+from support.session import BrowserTestCase
+
+
+# Time budgets are for an unthrottled CPU and scale with CPU_THROTTLE.
+FIRST_CARDS_BUDGET_MS = 1000
+INPUT_COMMIT_BUDGET_MS = 50
+INPUT_FRAME_BUDGET_MS = 100
+LONG_TASK_BUDGET_MS = 100
+SCRIPT_PER_INPUT_BUDGET_MS = 50
+LAYOUTS_PER_INPUT_BUDGET = 5
+JS_HEAP_BUDGET_MB = 30
+
+
+class TestResponsiveness(BrowserTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # The session is pooled: leave no probe, throttling or metrics domain behind.
+        self.addCleanup(disable_metrics, self.driver)
+        self.addCleanup(remove_document_script, self.driver, install_probe(self.driver))
+        set_cpu_throttling(self.driver, CPU_THROTTLE)
+        self.addCleanup(set_cpu_throttling, self.driver, 1)
+
+    def budget_ms(self, budget: float) -> float:
+        return budget * CPU_THROTTLE
+
+    def open_transfer_form(self, balance: int, reserved: int, card: str):
+        result = first_render(self.driver, f"{BASE_URL}/?balance={balance}&reserved={reserved}")
+        self.page.forget()
+        self.page.enable_rubles()
+        self.page.card_input(card, clear=True)
+        return result
+
+    def assert_input_within_budget(self, amount: str, expect_error: bool) -> dict:
+        field = self.page.element("amount_input")
+        before = browser_metrics(self.driver)
+        latency = input_latency(self.driver, field, amount, expect_error)
+        delta = metrics_delta(before, browser_metrics(self.driver))
+        # ScriptDuration is reported in seconds.
+        latency["script_ms"] = delta["ScriptDuration"] * 1000
+        latency["layouts"] = delta["LayoutCount"]
+        measured = f"entering {amount}: {latency}"
+
+        self.assertIsNotNone(latency["commit_ms"], f"Commission did not update after {measured}")
+        self.assertEqual(latency["error"], expect_error, measured)
+        self.assertLessEqual(latency["commit_ms"], self.budget_ms(INPUT_COMMIT_BUDGET_MS), measured)
+        self.assertLessEqual(latency["frame_ms"], self.budget_ms(INPUT_FRAME_BUDGET_MS), measured)
+        self.assertLessEqual(max(latency["long_tasks"], default=0), self.budget_ms(LONG_TASK_BUDGET_MS), measured)
+        self.assertLessEqual(latency["script_ms"], self.budget_ms(SCRIPT_PER_INPUT_BUDGET_MS), measured)
+        self.assertLessEqual(latency["layouts"], LAYOUTS_PER_INPUT_BUDGET, measured)
+        return latency
+
+    def test_first_render_of_balance_cards(self):
+        result = first_render(self.driver, f"{BASE_URL}/?balance=30000&reserved=20001")
+        self.assertIsNotNone(result["first_cards_ms"], "Balance cards were not rendered")
+        self.assertLessEqual(result["first_cards_ms"], self.budget_ms(FIRST_CARDS_BUDGET_MS))
+        self.assertLessEqual(max(result["long_tasks"], default=0), self.budget_ms(LONG_TASK_BUDGET_MS))
+
+        heap_mb = browser_metrics(self.driver)["JSHeapUsedSize"] / 2 ** 20
+        self.assertLessEqual(heap_mb, JS_HEAP_BUDGET_MB)
+
+    # ---------- TC-001 ---------- #
+    def test_commission_recalculation_latency(self):
+        self.open_transfer_form(33000, 1000, "5559000000000000")
+        self.assert_input_within_budget("5000", expect_error=False)
+        self.assert_input_within_budget("1000", expect_error=False)
+
+    def test_error_state_latency(self):
+        self.open_transfer_form(33000, 1000, "5559000000000000")
+        self.assert_input_within_budget("30000", expect_error=True)
+        self.assert_input_within_budget("2000", expect_error=False)
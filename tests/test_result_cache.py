@@ -0,0 +1,100 @@
+import os
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from support import result_cache
+from support.result_cache import CACHEABLE_STATUSES, ResultCache
+
+
+class TestCacheKeys(unittest.TestCase):
+    """Ключ кэша меняется вместе с тем, от чего зависит результат теста; браузер не нужен."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        root = Path(directory.name)
+        self.dist = root / "dist"
+        self.dist.mkdir()
+        (self.dist / "index.html").write_text("<div id=root></div>", encoding="utf-8")
+        self.module_file = root / "test_fake.py"
+        self.module_file.write_text("# version 1\n", encoding="utf-8")
+
+        module = types.ModuleType("test_fake")
+        module.__file__ = str(self.module_file)
+        for patcher in (
+            mock.patch.dict(sys.modules, {"test_fake": module}),
+            mock.patch.object(result_cache, "DIST_DIR", self.dist),
+            # Keep the key independent of whatever Chrome this machine has.
+            mock.patch("support.drivers.installed_chrome_version", return_value="120.0"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def key(self) -> str:
+        return result_cache.test_keys(["test_fake.TestFake.test_one"])["test_fake.TestFake.test_one"]
+
+    def test_key_is_stable(self):
+        self.assertEqual(self.key(), self.key())
+
+    def test_key_follows_dist(self):
+        before = self.key()
+        (self.dist / "index.html").write_text("<div id=app></div>", encoding="utf-8")
+        self.assertNotEqual(self.key(), before)
+
+    def test_key_follows_test_module(self):
+        before = self.key()
+        self.module_file.write_text("# version 2\n", encoding="utf-8")
+        self.assertNotEqual(self.key(), before)
+
+    def test_key_follows_environment_switches(self):
+        before = self.key()
+        for name in ("ALERT_MODE", "SERVE_MODE"):
+            with self.subTest(name=name), mock.patch.dict(os.environ, {name: "changed"}):
+                self.assertNotEqual(self.key(), before)
+        with mock.patch.dict(os.environ, {"SOME_UNRELATED_VARIABLE": "changed"}):
+            self.assertEqual(self.key(), before)
+
+    def test_tests_of_one_module_get_different_keys(self):
+        keys = result_cache.test_keys(["test_fake.TestFake.test_one", "test_fake.TestFake.test_two"])
+        self.assertEqual(len(set(keys.values())), 2)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "cache.json"
+        self.cache = ResultCache(self.path)
+
+    def test_only_cacheable_statuses_are_stored(self):
+        statuses = list(CACHEABLE_STATUSES) + ["fail", "error", "unexpected success"]
+        records = [{"id": status, "status": status, "duration": 1.0} for status in statuses]
+        self.cache.store(records, {status: "key" for status in statuses})
+        self.assertEqual(sorted(self.cache.entries), sorted(CACHEABLE_STATUSES))
+
+    def test_lookup_needs_the_same_key(self):
+        self.cache.store([{"id": "test", "status": "ok", "duration": 1.0}], {"test": "key"})
+        self.assertEqual(self.cache.lookup("test", "key"), {"id": "test", "status": "ok", "duration": 1.0, "cached": True})
+        self.assertIsNone(self.cache.lookup("test", "other key"))
+        self.assertIsNone(self.cache.lookup("unknown", "key"))
+
+    def test_failure_evicts_cached_pass(self):
+        self.cache.store([{"id": "test", "status": "ok", "duration": 1.0}], {"test": "key"})
+        self.cache.store([{"id": "test", "status": "fail", "duration": 1.0}], {"test": "key"})
+        self.assertIsNone(self.cache.lookup("test", "key"))
+
+    def test_replayed_records_are_not_stored_again(self):
+        self.cache.store([{"id": "test", "status": "ok", "duration": 1.0}], {"test": "old key"})
+        replayed = self.cache.lookup("test", "old key")
+        self.cache.store([replayed], {"test": "new key"})
+        self.assertIsNone(self.cache.lookup("test", "new key"))
+        self.assertNotIn("cached", self.cache.entries["test"]["record"])
+
+    def test_entries_survive_save_and_load(self):
+        self.cache.store([{"id": "test", "status": "ok", "duration": 1.0}], {"test": "key"})
+        self.cache.save()
+        self.assertEqual(ResultCache(self.path).lookup("test", "key")["status"], "ok")
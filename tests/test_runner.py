@@ -0,0 +1,78 @@
+import unittest
+
+from support.runner import DURATION_SMOOTHING, RecordingResult, schedule, update_history
+
+
+class TestSchedule(unittest.TestCase):
+    """Распределение тестов по воркерам по истории прошлых запусков."""
+
+    def test_known_failures_come_first(self):
+        history = {
+            "slow": {"duration": 10.0, "status": "ok"},
+            "broken": {"duration": 1.0, "status": "fail"},
+            "crashed": {"duration": 2.0, "status": "error"},
+        }
+        self.assertEqual(schedule(["slow", "broken", "crashed"], 1, history), [["crashed", "broken", "slow"]])
+
+    def test_longest_first_onto_least_loaded_worker(self):
+        history = {test_id: {"duration": duration, "status": "ok"}
+                   for test_id, duration in {"a": 5.0, "b": 4.0, "c": 3.0, "d": 3.0, "e": 1.0}.items()}
+        # a -> 0; b -> 1; c -> 1 (4 < 5); d -> 0 (5 < 7); e -> 1 (7 < 8)
+        self.assertEqual(schedule(list("edcba"), 2, history), [["a", "d"], ["b", "c", "e"]])
+
+    def test_unknown_tests_take_the_average_duration(self):
+        history = {"long": {"duration": 6.0, "status": "ok"}, "short": {"duration": 2.0, "status": "ok"}}
+        # "new" counts as 4.0: after it and "long" the second worker (short) is the least loaded.
+        self.assertEqual(schedule(["short", "new", "long"], 2, history), [["long"], ["new", "short"]])
+
+    def test_without_history_every_test_counts_the_same(self):
+        self.assertEqual(schedule(["c", "a", "b"], 2), [["a", "c"], ["b"]])
+
+    def test_no_empty_shards(self):
+        self.assertEqual(schedule(["only"], 4), [["only"]])
+
+
+class TestUpdateHistory(unittest.TestCase):
+    def test_durations_are_smoothed(self):
+        history = {"test": {"duration": 4.0, "status": "ok"}}
+        updated = update_history(history, [{"id": "test", "duration": 2.0, "status": "fail"}])
+        expected = DURATION_SMOOTHING * 2.0 + (1 - DURATION_SMOOTHING) * 4.0
+        self.assertEqual(updated["test"], {"duration": expected, "status": "fail"})
+        self.assertEqual(history["test"]["duration"], 4.0, "История не должна меняться на месте")
+
+    def test_new_and_untouched_tests(self):
+        history = {"old": {"duration": 3.0, "status": "ok"}}
+        updated = update_history(history, [{"id": "new", "duration": 1.5, "status": "ok"}])
+        self.assertEqual(updated, {"old": {"duration": 3.0, "status": "ok"}, "new": {"duration": 1.5, "status": "ok"}})
+
+
+class TestRecordingResult(unittest.TestCase):
+    def run_case(self, test_method) -> dict:
+        case = type("Case", (unittest.TestCase,), {"test_method": test_method})("test_method")
+        result = RecordingResult()
+        case.run(result)
+        [record] = result.records
+        return record
+
+    def test_skipped_subtest_keeps_the_test_passing(self):
+        def test_method(case):
+            for index in range(3):
+                with case.subTest(index=index):
+                    if index == 0:
+                        case.skipTest("not implemented in the app")
+
+        record = self.run_case(test_method)
+        self.assertEqual(record["status"], "ok")
+        self.assertEqual(record["skipped_subtests"], 1)
+
+    def test_skipped_test(self):
+        record = self.run_case(lambda case: case.skipTest("no browser"))
+        self.assertEqual((record["status"], record["details"]), ("skipped", "no browser"))
+
+    def test_failed_subtest_fails_the_test(self):
+        def test_method(case):
+            for index in range(2):
+                with case.subTest(index=index):
+                    case.assertEqual(index, 0)
+
+        self.assertEqual(self.run_case(test_method)["status"], "fail")
@@ -0,0 +1,114 @@
+import gzip
+import http.client
+import tempfile
+import unittest
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from support import server
+from support.server import IMMUTABLE_CACHE, REVALIDATE_CACHE, accepted_encodings, serve_dist
+
+
+SCRIPT = ("console.log('transfer');\n" * 200).encode()
+INDEX = b'<!doctype html><script type="module" src="/assets/index-abc123.js"></script><div id="root"></div>'
+IMAGE = bytes(range(256))
+
+
+class TestDistServer(unittest.TestCase):
+    """Сервер dist/ без браузера: сжатие, кэширование, условные запросы и HEAD."""
+
+    @classmethod
+    def setUpClass(cls):
+        directory = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(directory.cleanup)
+        root = Path(directory.name)
+        (root / "assets").mkdir()
+        (root / "index.html").write_bytes(INDEX)
+        (root / "assets" / "index-abc123.js").write_bytes(SCRIPT)
+        (root / "assets" / "logo.png").write_bytes(IMAGE)
+        address = urlsplit(cls.enterClassContext(serve_dist(root=root)))
+        cls.host, cls.port = address.hostname, address.port
+
+    def request(self, path: str, method: str = "GET", **headers) -> tuple[http.client.HTTPResponse, bytes]:
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=5)
+        self.addCleanup(connection.close)
+        connection.request(method, path, headers={name.replace("_", "-"): value for name, value in headers.items()})
+        response = connection.getresponse()
+        return response, response.read()
+
+    def test_identity_without_accept_encoding(self):
+        response, body = self.request("/assets/index-abc123.js")
+        self.assertEqual(response.status, 200)
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertEqual(body, SCRIPT)
+        self.assertEqual(response.getheader("Content-Length"), str(len(SCRIPT)))
+        self.assertEqual(response.getheader("Vary"), "Accept-Encoding")
+
+    def test_gzip(self):
+        response, body = self.request("/assets/index-abc123.js", Accept_Encoding="gzip, deflate")
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(gzip.decompress(body), SCRIPT)
+        self.assertEqual(response.getheader("Content-Length"), str(len(body)))
+
+    @unittest.skipIf(server.brotli is None, "brotli is not installed")
+    def test_brotli_preferred(self):
+        response, body = self.request("/assets/index-abc123.js", Accept_Encoding="gzip, br")
+        self.assertEqual(response.getheader("Content-Encoding"), "br")
+        self.assertEqual(server.brotli.decompress(body), SCRIPT)
+
+    def test_refused_encodings(self):
+        response, body = self.request("/assets/index-abc123.js", Accept_Encoding="gzip;q=0, br;q=0.0, identity")
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertEqual(body, SCRIPT)
+        self.assertEqual(accepted_encodings("gzip;q=0, br;q=0.5, identity"), {"br", "identity"})
+
+    def test_binary_files_are_not_compressed(self):
+        response, body = self.request("/assets/logo.png", Accept_Encoding="gzip")
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertIsNone(response.getheader("Vary"))
+        self.assertEqual(body, IMAGE)
+
+    def test_cache_control(self):
+        for path, expected in [
+            ("/assets/index-abc123.js", IMMUTABLE_CACHE),
+            ("/assets/logo.png", IMMUTABLE_CACHE),
+            ("/", REVALIDATE_CACHE),
+            ("/index.html", REVALIDATE_CACHE),
+        ]:
+            with self.subTest(path):
+                response, _ = self.request(path)
+                self.assertEqual(response.getheader("Cache-Control"), expected)
+        response, body = self.request("/")
+        self.assertEqual((response.getheader("Content-Type"), body), ("text/html; charset=utf-8", INDEX))
+
+    def test_each_encoding_has_its_own_etag(self):
+        identity, _ = self.request("/assets/index-abc123.js")
+        compressed, _ = self.request("/assets/index-abc123.js", Accept_Encoding="gzip")
+        self.assertNotEqual(identity.getheader("ETag"), compressed.getheader("ETag"))
+        self.assertTrue(compressed.getheader("ETag").startswith('"') and compressed.getheader("ETag").endswith('"'))
+
+    def test_if_none_match(self):
+        first, _ = self.request("/assets/index-abc123.js", Accept_Encoding="gzip")
+        etag = first.getheader("ETag")
+
+        response, body = self.request("/assets/index-abc123.js", Accept_Encoding="gzip", If_None_Match=etag)
+        self.assertEqual((response.status, body), (304, b""))
+        self.assertEqual(response.getheader("ETag"), etag)
+
+        response, body = self.request("/assets/index-abc123.js", If_None_Match=etag)
+        self.assertEqual(response.status, 200, "Тег сжатого варианта не подходит к несжатому")
+        self.assertEqual(body, SCRIPT)
+
+        response, _ = self.request("/assets/index-abc123.js", Accept_Encoding="gzip", If_None_Match=f'"other", {etag}')
+        self.assertEqual(response.status, 304)
+
+    def test_head(self):
+        get, _ = self.request("/assets/index-abc123.js", Accept_Encoding="gzip")
+        head, body = self.request("/assets/index-abc123.js", "HEAD", Accept_Encoding="gzip")
+        self.assertEqual((head.status, body), (200, b""))
+        for header in ("Content-Type", "Content-Length", "Content-Encoding", "ETag", "Cache-Control"):
+            self.assertEqual(head.getheader(header), get.getheader(header), header)
+
+    def test_unknown_path(self):
+        response, _ = self.request("/missing.js")
+        self.assertEqual(response.status, 404)
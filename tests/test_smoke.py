@@ -0,0 +1,38 @@
+import base64
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from support.interception import dist_assets, response_for
+from support.server import DIST_DIR, serve_dist
+from support.smoke import REQUIRED_IDS, bundle_ids, check_app
+
+
+class TestSmoke(unittest.TestCase):
+    """Проверки собранного приложения без браузера."""
+
+    def test_served_app(self):
+        with serve_dist() as base_url:
+            self.assertEqual(check_app(base_url, DIST_DIR), [])
+
+    def test_bundle_renders_required_ids(self):
+        bundle = next((DIST_DIR / "assets").glob("*.js")).read_text(encoding="utf-8")
+        self.assertLessEqual(set(REQUIRED_IDS), bundle_ids(bundle))
+
+    def test_missing_asset_is_reported(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory) / "dist"
+            shutil.copytree(DIST_DIR, root)
+            for stylesheet in (root / "assets").glob("*.css"):
+                stylesheet.unlink()
+            with serve_dist(root=root) as base_url:
+                problems = check_app(base_url, root)
+        self.assertEqual(len(problems), 1)
+        self.assertIn("HTTP 404", problems[0])
+
+    def test_memory_origin_answers_from_dist(self):
+        index = response_for("http://dist.localhost/?balance=30000&reserved=20001", dist_assets())
+        self.assertEqual(index["responseCode"], 200)
+        self.assertEqual(base64.b64decode(index["body"]), (DIST_DIR / "index.html").read_bytes())
+        self.assertEqual(response_for("http://dist.localhost/missing.js", dist_assets())["responseCode"], 404)
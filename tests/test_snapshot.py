@@ -0,0 +1,81 @@
+import unittest
+
+from support.session import BrowserTestCase
+from support.snapshot import AccountState, parse_snapshot
+
+
+def raw_snapshot(**changes) -> dict:
+    """What the page script returns for a freshly opened page with balance=30000&reserved=20001."""
+    raw = {
+        "accounts": {
+            "rub": {"balance": "30'000", "reserved": "20'001"},
+            "usd": {"balance": "100", "reserved": "0"},
+            "euro": {"balance": "300", "reserved": "26"},
+        },
+        "transfer_open": False,
+        "card_number": None,
+        "amount": None,
+        "commission": None,
+        "currency": None,
+        "error": None,
+        "send_button": False,
+    }
+    raw.update(changes)
+    return raw
+
+
+class TestParseSnapshot(unittest.TestCase):
+    """Разбор снимка экрана перевода без браузера."""
+
+    def test_thousand_separators_are_stripped(self):
+        snapshot = parse_snapshot(raw_snapshot())
+        self.assertEqual(snapshot.rub, AccountState(balance="30000", reserved="20001"))
+        self.assertEqual(snapshot.euro, AccountState(balance="300", reserved="26"))
+        self.assertFalse(snapshot.transfer_open)
+        self.assertIsNone(snapshot.selected_account)
+
+    def test_missing_account_values_stay_none(self):
+        accounts = {"rub": {"balance": None, "reserved": None}}
+        snapshot = parse_snapshot(raw_snapshot(accounts=accounts))
+        self.assertEqual(snapshot.rub, AccountState(balance=None, reserved=None))
+
+    def test_currency_selects_the_account(self):
+        for currency, account in [("₽", "rub"), ("$", "usd"), ("€", "euro"), ("%", None), (None, None)]:
+            with self.subTest(currency=currency):
+                snapshot = parse_snapshot(raw_snapshot(transfer_open=True, commission="100", currency=currency))
+                self.assertEqual(snapshot.selected_account, account)
+
+    def test_allowed_transfer(self):
+        snapshot = parse_snapshot(raw_snapshot(
+            transfer_open=True, card_number="5559 0000 0000 0000", amount="1000",
+            commission="100", currency="₽", send_button=True,
+        ))
+        self.assertEqual((snapshot.card_number, snapshot.amount, snapshot.commission), ("5559 0000 0000 0000", "1000", "100"))
+        self.assertIsNone(snapshot.error)
+        self.assertTrue(snapshot.send_button)
+
+    def test_error_state(self):
+        snapshot = parse_snapshot(raw_snapshot(
+            transfer_open=True, amount="30000", commission="3000", currency="₽", error="Недостаточно средств на счете",
+        ))
+        self.assertEqual(snapshot.error, "Недостаточно средств на счете")
+        self.assertFalse(snapshot.send_button)
+
+    def test_snapshots_compare_as_values(self):
+        self.assertEqual(parse_snapshot(raw_snapshot()), parse_snapshot(raw_snapshot()))
+        self.assertNotEqual(parse_snapshot(raw_snapshot()), parse_snapshot(raw_snapshot(amount="1")))
+
+
+class TestTakeSnapshot(BrowserTestCase):
+    def test_snapshot_of_an_overdraft(self):
+        self.page.open(30000, 20001)
+        self.assertEqual(self.snapshot().rub, AccountState(balance="30000", reserved="20001"))
+
+        self.page.enable_rubles()
+        self.page.card_input("5559000000000000", clear=True)
+        self.page.amount_input("10000")
+        snapshot = self.snapshot()
+        self.assertTrue(snapshot.transfer_open)
+        self.assertEqual((snapshot.selected_account, snapshot.amount, snapshot.commission), ("rub", "10000", "1000"))
+        self.assertIsNotNone(snapshot.error, "10 000 ₽ с комиссией больше доступных 9 999 ₽")
+        self.assertFalse(snapshot.send_button)
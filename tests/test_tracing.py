@@ -0,0 +1,74 @@
+import io
+import unittest
+
+from support.tracing import Tracer, aggregate, print_summary
+
+
+def span(name: str, duration: float, event_type: str = "step", kind: str = "act", depth: int = 0) -> dict:
+    return {"type": event_type, "test": "test_id", "name": name, "kind": kind, "depth": depth, "duration": duration}
+
+
+EVENTS = [
+    {"type": "test", "test": "test_fast", "name": "test_fast", "duration": 0.5},
+    {"type": "test", "test": "test_slow", "name": "test_slow", "duration": 3.0},
+    span("TransferPage.open", 1.0, kind="load"),
+    span("get", 0.9, "command", depth=1),
+    span("TransferPage.card_input", 0.2),
+    span("executeScript", 0.15, "command", depth=1),
+    span("TransferPage.card_input", 0.3),
+    span("executeScript", 0.25, "command", depth=1),
+    span("TransferPage.accept_alert", 0.4, kind="wait"),
+    span("executeScript", 0.1, "command", kind="act"),
+]
+
+
+class TestTraceSummary(unittest.TestCase):
+    """Сводка трассировки по синтетическим событиям, без браузера."""
+
+    def test_aggregate_counts_totals_and_orders_by_total(self):
+        rows = aggregate([event for event in EVENTS if event["type"] == "step"])
+        self.assertEqual([(name, calls) for name, calls, _, _ in rows], [
+            ("TransferPage.open", 1), ("TransferPage.card_input", 2), ("TransferPage.accept_alert", 1),
+        ])
+        name, calls, total, longest = rows[1]
+        self.assertAlmostEqual(total, 0.5)
+        self.assertAlmostEqual(longest, 0.3)
+
+    def test_summary(self):
+        stream = io.StringIO()
+        print_summary(EVENTS, stream)
+        lines = stream.getvalue().splitlines()
+
+        tests = lines[lines.index("Slowest tests:") + 1:][:2]
+        self.assertEqual([line.split()[-1] for line in tests], ["test_slow", "test_fast"])
+
+        commands = lines[lines.index("Slowest WebDriver commands (total / calls / max):") + 1:][:2]
+        self.assertEqual([line.split() for line in commands], [
+            ["0.900s", "1", "0.900s", "get"], ["0.500s", "3", "0.250s", "executeScript"],
+        ])
+
+        # Only outermost spans count: 1.0 load, 0.2 + 0.3 + 0.1 act, 0.4 wait.
+        by_kind = [line.split() for line in lines[lines.index("Time by kind:") + 1:]]
+        self.assertEqual(by_kind, [["1.000s", "load"], ["0.600s", "act"], ["0.400s", "wait"]])
+
+
+class TestTracer(unittest.TestCase):
+    def test_nested_steps_record_their_depth(self):
+        tracer = Tracer(enabled=True)
+        tracer.test_started("test_id")
+        with tracer.step("TransferPage.open", "load"):
+            with tracer.step("get", event_type="command"):
+                pass
+        tracer.test_finished()
+        self.assertEqual(
+            [(event["type"], event["name"], event.get("depth")) for event in tracer.events],
+            [("command", "get", 1), ("step", "TransferPage.open", 0), ("test", "test_id", None)],
+        )
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer(enabled=False)
+        tracer.test_started("test_id")
+        with tracer.step("TransferPage.open"):
+            pass
+        tracer.test_finished()
+        self.assertEqual(tracer.events, [])
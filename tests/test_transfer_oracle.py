@@ -0,0 +1,59 @@
+import unittest
+
+from support.config import ORACLE_CASES, ORACLE_SEED
+from support.oracle import Case, check_cases, chunks, compare, expect, generate_cases, group_by_preconditions
+from support.session import BrowserTestCase
+from support.waits import wait_until_settled
+
+
+BATCH_SIZE = 200
+REPORTED_MISMATCHES = 20
+
+
+class TestTransferOracleModel(unittest.TestCase):
+    """The oracle itself must agree with the literals in the hand-written tests."""
+
+    def test_commission_matches_test_cases(self):
+        self.assertEqual(expect(Case(33000, 1000, "rub", "5559000000000000", "5000")).commission, 500)
+        self.assertEqual(expect(Case(33000, 1000, "rub", "1234567890901122", "99")).commission, 9)
+        self.assertEqual(expect(Case(10000, 0, "rub", "5559000000000000", "1234")).commission, 123)
+
+    def test_exact_available_balance_is_allowed(self):
+        self.assertTrue(expect(Case(1100, 0, "rub", "5559000000000000", "1000")).allowed)
+        self.assertFalse(expect(Case(1100, 0, "rub", "5559000000000000", "1001")).allowed)
+
+    def test_card_must_have_sixteen_digits(self):
+        for card, accepted in [("123456789012", False), ("123456789012345678", False), ("5559000000000000", True)]:
+            with self.subTest(card=card):
+                self.assertEqual(expect(Case(33000, 1000, "rub", card, "1000")).card_accepted, accepted)
+
+    def test_non_positive_amount_is_rejected(self):
+        for amount in ["0", "-100"]:
+            with self.subTest(amount=amount):
+                self.assertFalse(expect(Case(33000, 2000, "rub", "1111111111111111", amount)).allowed)
+
+    def test_fixed_accounts_use_their_own_balance(self):
+        self.assertFalse(expect(Case(33000, 1000, "usd", "4000123456789000", "3111")).allowed)
+        self.assertFalse(expect(Case(33000, 2000, "euro", "1111111111111111", "1500")).allowed)
+
+    def test_generation_is_reproducible(self):
+        self.assertEqual(generate_cases(50, seed=7), generate_cases(50, seed=7))
+
+
+class TestTransferOracle(BrowserTestCase):
+    def test_generated_cases_match_oracle(self):
+        cases = generate_cases(ORACLE_CASES, ORACLE_SEED)
+        for (balance, reserved), group in group_by_preconditions(cases).items():
+            with self.subTest(balance=balance, reserved=reserved, cases=len(group)):
+                self.page.open(balance, reserved)
+                wait_until_settled(self.driver)
+
+                mismatches = []
+                for batch in chunks(group, BATCH_SIZE):
+                    for case, snapshot in zip(batch, check_cases(self.driver, batch)):
+                        mismatches.extend(compare(case, snapshot))
+
+                self.assertFalse(
+                    mismatches,
+                    f"{len(mismatches)} mismatches, first ones:\n" + "\n".join(mismatches[:REPORTED_MISMATCHES]),
+                )
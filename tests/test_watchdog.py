@@ -0,0 +1,89 @@
+import subprocess
+import sys
+import time
+import unittest
+from unittest import mock
+
+from support import session, watchdog as watchdog_module
+from support.watchdog import PROC, Watchdog, kill_tree, process_tree, start_time, tree_rss
+
+# A stand-in for chromedriver with one child, like Chrome.
+PARENT_SCRIPT = "import subprocess, sys; subprocess.run([sys.executable, '-c', 'import time; time.sleep(30)'])"
+
+
+@unittest.skipUnless(watchdog_module.psutil is not None or PROC.is_dir(), "process trees cannot be read here")
+class TestWatchdog(unittest.TestCase):
+    """Контроль процессов браузера без запуска браузера: вместо chromedriver - python с дочерним процессом."""
+
+    def start_tree(self) -> subprocess.Popen:
+        process = subprocess.Popen([sys.executable, "-c", PARENT_SCRIPT])
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+        deadline = time.monotonic() + 5
+        while len(process_tree(process.pid)) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return process
+
+    def assert_tree_killed(self, process: subprocess.Popen, tree: list[int]):
+        process.wait(timeout=5)
+        deadline = time.monotonic() + 5
+        while any(process_tree(pid) for pid in tree[1:]) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual([pid for pid in tree[1:] if process_tree(pid)], [])
+
+    def test_tree_and_rss(self):
+        process = self.start_tree()
+        self.assertEqual(len(process_tree(process.pid)), 2)
+        self.assertGreater(tree_rss(process.pid), 0)
+
+    def test_reap_kills_the_whole_tree(self):
+        process = self.start_tree()
+        tree = process_tree(process.pid)
+        watchdog = Watchdog()
+        watchdog._started[process.pid] = start_time(process.pid)
+
+        self.assertEqual(watchdog.reap(), [process.pid])
+        self.assert_tree_killed(process, tree)
+
+    def test_reap_spares_finished_browsers(self):
+        process = self.start_tree()
+        watchdog = Watchdog()
+        watchdog._started[process.pid] = start_time(process.pid)
+        process.kill()
+        process.wait()
+        self.assertEqual(watchdog.reap(), [])
+
+    @unittest.skipUnless(PROC.is_dir(), "the fallback reads /proc")
+    def test_kill_tree_without_psutil(self):
+        process = self.start_tree()
+        tree = process_tree(process.pid)
+        with mock.patch.object(watchdog_module, "psutil", None):
+            self.assertEqual(process_tree(process.pid), tree)
+            kill_tree(process.pid)
+        self.assert_tree_killed(process, tree)
+
+
+class TestSessionRelease(unittest.TestCase):
+    """Порядок действий пула при возврате сессии; браузер заменён заглушкой."""
+
+    def test_memory_is_sampled_before_reset(self):
+        calls = []
+        pool = session.SessionPool(factory=mock.Mock())
+        session._pools.remove(pool)
+        pool._driver = driver = mock.Mock()
+        with mock.patch.object(session, "watchdog") as watchdog, mock.patch.object(pool, "reset") as reset:
+            watchdog.over_budget.side_effect = lambda *args: calls.append("sample") or True
+            reset.side_effect = lambda *args: calls.append("reset")
+            with mock.patch.object(session, "discard"):
+                pool.release(driver, "test_id")
+        self.assertEqual(calls, ["sample", "reset"])
+        watchdog.over_budget.assert_called_once_with(driver, "test_id")
+        self.assertIsNone(pool._driver, "Сессия сверх лимита памяти должна быть перезапущена")
+
+    def test_discard_kills_chromedriver_when_the_tree_is_unknown(self):
+        driver = mock.Mock()
+        driver.quit.side_effect = session.WebDriverException("hung")
+        with mock.patch.object(session, "kill_tree") as kill_tree_mock:
+            session.discard(driver)
+        kill_tree_mock.assert_called_once_with(driver.service.process.pid)
+        driver.service.process.kill.assert_called_once_with()